@@ -1,5 +1,5 @@
 import git
-from typing import List, Tuple, Optional, Set
+from typing import Dict, Iterable, List, Tuple, Optional, Set, Union
 import os
 from pathlib import Path  # Added for Path.match()
 
@@ -97,6 +97,41 @@ class GitUtils:
             "committed_date": commit.committed_datetime,
         }
 
+    def get_commit_details_bulk(
+        self, commits: Iterable[Union[git.Commit, str]]
+    ) -> Dict[str, dict]:
+        """
+        Extracts details for many commits in one call.
+
+        Commit objects (e.g. from `get_commits_between`) are used as they are, so
+        callers that already hold them don't pay for a second lookup; bare SHAs
+        are resolved through the repository.
+
+        Args:
+            commits: Commit objects or full commit SHAs.
+
+        Returns:
+            A dict mapping each SHA to the same details dict as `get_commit_details`,
+            in input order with duplicates dropped.
+
+        Raises:
+            GitRepoError: If a SHA cannot be resolved to a commit.
+        """
+        details_by_sha: Dict[str, dict] = {}
+        for commit in commits:
+            if isinstance(commit, str):
+                if commit in details_by_sha:
+                    continue
+                try:
+                    commit = self.repo.commit(commit)
+                except Exception as e:  # Bad names, missing or non-commit objects
+                    raise GitRepoError(
+                        f"Invalid commit SHA in get_commit_details_bulk: '{commit}': {e}"
+                    )
+            if commit.hexsha not in details_by_sha:
+                details_by_sha[commit.hexsha] = self.get_commit_details(commit)
+        return details_by_sha
+
     def get_changed_files_in_commit(self, commit_sha: str) -> List[str]:
         """
         Gets a list of files changed in a specific commit.
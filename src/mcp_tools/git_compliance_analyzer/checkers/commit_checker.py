@@ -83,8 +83,20 @@ def check_commit_history(
 
     # Conventional Commit Format Check
     if rules.conventional_commit_format and rules.conventional_commit_format.enabled:
+        try:
+            details_by_sha = git_utils.get_commit_details_bulk(commits_to_check)
+        except GitRepoError as e:
+            findings.append(
+                ComplianceFinding(
+                    rule_id="GIT_COMMIT_HISTORY_ERROR",
+                    severity="High",
+                    message=f"Error reading commit details between '{base_revision}' and '{head_revision}': {e}",
+                )
+            )
+            return findings
+
         for commit_obj in commits_to_check:
-            commit_details = git_utils.get_commit_details(commit_obj)
+            commit_details = details_by_sha[commit_obj.hexsha]
             findings.extend(
                 check_commit_conventional_format_single(
                     commit_sha=commit_details["sha"],
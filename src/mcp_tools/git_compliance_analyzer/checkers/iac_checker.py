@@ -1,131 +1,342 @@
+import asyncio
+import hashlib
 import subprocess
-import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..models import ComplianceFinding
 from ..config import IaCValidationRules, IaCValidationRuleItem
+from ...common.git_utils import GitUtils
 
 
-def run_iac_validation_command(
-    repo_root_path: Path,  # Absolute path to the root of the Git repository
-    rule: IaCValidationRuleItem,
-) -> List[ComplianceFinding]:
-    """
-    Runs a configured IaC validation command (e.g., 'terraform validate').
-    """
-    findings: List[ComplianceFinding] = []
-    if not rule.enabled:
-        return findings
+# Upper bound on concurrent validation subprocesses, shared by the thread-pool
+# (check_iac_validations) and asyncio (run_iac_validation_command_async) paths.
+MAX_VALIDATION_WORKERS = 8
+
+# When check_iac_validations runs with use_cache=True: monotonic time of the last
+# passing run per (repo root, HEAD sha, rules config hash). Only useful to a
+# long-lived caller that validates the same checkout repeatedly.
+FINDINGS_CACHE_TTL_SECONDS = 30 * 60
+_FINDINGS_CACHE: Dict[Tuple[str, str, str], float] = {}
+
 
+def _build_validation_command(rule: IaCValidationRuleItem) -> Optional[List[str]]:
+    """Returns the command line for a rule type, or None if the type is unknown."""
     if rule.type == "terraform_validate":
-        command = ["terraform", "validate", "-no-color"]
         # Add "-json" in future if we want to parse structured output,
         # but that requires Terraform v0.15+ and changes how errors are reported.
         # For now, capture stdout/stderr as text.
+        return ["terraform", "validate", "-no-color"]
     # Elif rule.type == "terrascan_run":
-    #    command = ["terrascan", "scan", "-i", "terraform", "-p", "."] # Example
-    else:
+    #    return ["terrascan", "scan", "-i", "terraform", "-p", "."] # Example
+    return None
+
+
+def _unknown_type_finding(rule: IaCValidationRuleItem) -> ComplianceFinding:
+    return ComplianceFinding(
+        rule_id="IAC_VALIDATION_UNKNOWN_TYPE",
+        severity="Medium",  # Or configurable
+        message=f"Unknown IaC validation type specified in rule: '{rule.type}'.",
+        details={"configured_rule_type": rule.type},
+    )
+
+
+def _check_validation_path(
+    repo_root_path: Path, relative_path_to_check: str
+) -> Tuple[Path, List[ComplianceFinding]]:
+    """
+    Resolves a rule path against the (already resolved) repo root. Returns the
+    absolute directory and any findings that mean the command must not run there.
+    """
+    findings: List[ComplianceFinding] = []
+
+    # Ensure path is within the repo and exists. resolve() is kept (rather than a
+    # purely lexical normpath) so symlinks pointing outside the repo are caught.
+    check_dir_abs = (repo_root_path / relative_path_to_check).resolve()
+
+    # Security check: ensure check_dir_abs is still within repo_root_path.
+    # is_relative_to is a single prefix comparison instead of a walk over .parents.
+    if not check_dir_abs.is_relative_to(repo_root_path):
         findings.append(
             ComplianceFinding(
-                rule_id="IAC_VALIDATION_UNKNOWN_TYPE",
-                severity="Medium",  # Or configurable
-                message=f"Unknown IaC validation type specified in rule: '{rule.type}'.",
-                details={"configured_rule_type": rule.type},
+                rule_id="IAC_VALIDATION_PATH_OUTSIDE_REPO",
+                severity="High",
+                message=f"IaC validation path '{relative_path_to_check}' resolves outside the repository root. Skipping.",
+                file_path=str(relative_path_to_check),
             )
         )
-        return findings
+        return check_dir_abs, findings
 
-    for relative_path_to_check in rule.paths:
-        # Ensure path is within the repo and exists
-        check_dir_abs = (repo_root_path / relative_path_to_check).resolve()
-
-        # Security check: ensure check_dir_abs is still within repo_root_path
-        if (
-            repo_root_path not in check_dir_abs.parents
-            and check_dir_abs != repo_root_path
-        ):
-            findings.append(
-                ComplianceFinding(
-                    rule_id="IAC_VALIDATION_PATH_OUTSIDE_REPO",
-                    severity="High",
-                    message=f"IaC validation path '{relative_path_to_check}' resolves outside the repository root. Skipping.",
-                    file_path=str(relative_path_to_check),
-                )
+    if not check_dir_abs.is_dir():
+        findings.append(
+            ComplianceFinding(
+                rule_id="IAC_VALIDATION_PATH_NOT_DIR",
+                severity="Medium",
+                message=f"Path specified for IaC validation '{relative_path_to_check}' is not a directory or does not exist: {check_dir_abs}",
+                file_path=str(relative_path_to_check),
             )
-            continue
+        )
+    return check_dir_abs, findings
 
-        if not check_dir_abs.is_dir():
-            findings.append(
-                ComplianceFinding(
-                    rule_id="IAC_VALIDATION_PATH_NOT_DIR",
-                    severity="Medium",
-                    message=f"Path specified for IaC validation '{relative_path_to_check}' is not a directory or does not exist: {check_dir_abs}",
-                    file_path=str(relative_path_to_check),
-                )
+
+def _command_result_findings(
+    rule: IaCValidationRuleItem,
+    command: List[str],
+    relative_path_to_check: str,
+    check_dir_abs: Path,
+    returncode: int,
+    stdout: str,
+    stderr: str,
+) -> List[ComplianceFinding]:
+    findings: List[ComplianceFinding] = []
+    if returncode != 0:
+        findings.append(
+            ComplianceFinding(
+                rule_id=f"{rule.type.upper()}_FAILED",  # e.g., TERRAFORM_VALIDATE_FAILED
+                severity=rule.severity,
+                message=f"IaC validation command '{' '.join(command)}' failed in '{check_dir_abs}'. Exit code: {returncode}.",
+                file_path=str(relative_path_to_check),  # Path relative to repo root
+                details={
+                    "command": " ".join(command),
+                    "stdout": stdout.strip(),
+                    "stderr": stderr.strip(),
+                    "exit_code": returncode,
+                },
             )
-            continue
+        )
+    # Even if returncode is 0, some tools might print warnings to stderr.
+    # For now, only non-zero exit code is a failure.
+    # Could add checks for specific output patterns if needed.
+    return findings
 
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(check_dir_abs)  # Run the command from within the target directory
-            print(f"  Running '{' '.join(command)}' in '{check_dir_abs}'...")
+
+def _command_error_finding(
+    rule: IaCValidationRuleItem,
+    command: List[str],
+    relative_path_to_check: str,
+    check_dir_abs: Path,
+    error: Exception,
+) -> ComplianceFinding:
+    if isinstance(error, FileNotFoundError):  # Command not found (e.g. terraform not in PATH)
+        return ComplianceFinding(
+            rule_id=f"{rule.type.upper()}_CMD_NOT_FOUND",
+            severity="High",
+            message=f"IaC validation command '{command[0]}' not found. Ensure it is installed and in PATH.",
+            file_path=str(relative_path_to_check),
+            details={"command_tried": command[0]},
+        )
+    return ComplianceFinding(
+        rule_id=f"{rule.type.upper()}_EXECUTION_ERROR",
+        severity="High",
+        message=f"Error executing IaC validation command '{' '.join(command)}' in '{check_dir_abs}': {error}",
+        file_path=str(relative_path_to_check),
+    )
+
+
+def _run_validation_in_path(
+    repo_root_path: Path,
+    rule: IaCValidationRuleItem,
+    command: List[str],
+    relative_path_to_check: str,
+) -> List[ComplianceFinding]:
+    """
+    Runs `command` for a single rule path. Safe to call from worker threads:
+    the command runs with `cwd=` instead of changing the process-wide CWD.
+    """
+    check_dir_abs, findings = _check_validation_path(
+        repo_root_path, relative_path_to_check
+    )
+    if findings:
+        return findings
+
+    try:
+        print(f"  Running '{' '.join(command)}' in '{check_dir_abs}'...")
+        # Output goes to temp files rather than pipes: no pipe fds or drain threads
+        # per concurrent command, and each file is read once after exit.
+        with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
             process = subprocess.run(
-                command, capture_output=True, text=True, check=False
+                command,
+                stdout=stdout_file,
+                stderr=stderr_file,
+                check=False,
+                cwd=check_dir_abs,
             )  # check=False to handle non-zero exits
+            stdout_file.seek(0)
+            stderr_file.seek(0)
+            stdout = stdout_file.read().decode(errors="replace")
+            stderr = stderr_file.read().decode(errors="replace")
+        findings.extend(
+            _command_result_findings(
+                rule,
+                command,
+                relative_path_to_check,
+                check_dir_abs,
+                process.returncode,
+                stdout,
+                stderr,
+            )
+        )
+    except Exception as e:
+        findings.append(
+            _command_error_finding(rule, command, relative_path_to_check, check_dir_abs, e)
+        )
+
+    return findings
+
+
+async def _run_validation_in_path_async(
+    repo_root_path: Path,
+    rule: IaCValidationRuleItem,
+    command: List[str],
+    relative_path_to_check: str,
+    semaphore: asyncio.Semaphore,
+) -> List[ComplianceFinding]:
+    """
+    Event-loop friendly variant of `_run_validation_in_path`. `semaphore` bounds
+    how many commands run at once.
+    """
+    check_dir_abs, findings = _check_validation_path(
+        repo_root_path, relative_path_to_check
+    )
+    if findings:
+        return findings
 
-            if process.returncode != 0:
-                findings.append(
-                    ComplianceFinding(
-                        rule_id=f"{rule.type.upper()}_FAILED",  # e.g., TERRAFORM_VALIDATE_FAILED
-                        severity=rule.severity,
-                        message=f"IaC validation command '{' '.join(command)}' failed in '{check_dir_abs}'. Exit code: {process.returncode}.",
-                        file_path=str(
-                            relative_path_to_check
-                        ),  # Path relative to repo root
-                        details={
-                            "command": " ".join(command),
-                            "stdout": process.stdout.strip(),
-                            "stderr": process.stderr.strip(),
-                            "exit_code": process.returncode,
-                        },
-                    )
-                )
-            # Even if returncode is 0, some tools might print warnings to stderr.
-            # For now, only non-zero exit code is a failure.
-            # Could add checks for specific output patterns if needed.
-
-        except FileNotFoundError:  # Command not found (e.g. terraform not in PATH)
-            findings.append(
-                ComplianceFinding(
-                    rule_id=f"{rule.type.upper()}_CMD_NOT_FOUND",
-                    severity="High",
-                    message=f"IaC validation command '{command[0]}' not found. Ensure it is installed and in PATH.",
-                    file_path=str(relative_path_to_check),
-                    details={"command_tried": command[0]},
-                )
+    try:
+        async with semaphore:
+            print(f"  Running '{' '.join(command)}' in '{check_dir_abs}'...")
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=str(check_dir_abs),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-        except Exception as e:
-            findings.append(
-                ComplianceFinding(
-                    rule_id=f"{rule.type.upper()}_EXECUTION_ERROR",
-                    severity="High",
-                    message=f"Error executing IaC validation command '{' '.join(command)}' in '{check_dir_abs}': {e}",
-                    file_path=str(relative_path_to_check),
-                )
+            stdout, stderr = await process.communicate()
+        findings.extend(
+            _command_result_findings(
+                rule,
+                command,
+                relative_path_to_check,
+                check_dir_abs,
+                process.returncode,  # type: ignore[arg-type]  # Set once communicate() returns
+                stdout.decode(errors="replace"),
+                stderr.decode(errors="replace"),
             )
-        finally:
-            os.chdir(original_cwd)
+        )
+    except Exception as e:
+        findings.append(
+            _command_error_finding(rule, command, relative_path_to_check, check_dir_abs, e)
+        )
 
     return findings
 
 
+def run_iac_validation_command(
+    repo_root_path: Path,  # Absolute path to the root of the Git repository
+    rule: IaCValidationRuleItem,
+) -> List[ComplianceFinding]:
+    """
+    Runs a configured IaC validation command (e.g., 'terraform validate').
+    """
+    findings: List[ComplianceFinding] = []
+    if not rule.enabled:
+        return findings
+
+    command = _build_validation_command(rule)
+    if command is None:
+        findings.append(_unknown_type_finding(rule))
+        return findings
+
+    repo_root_path = repo_root_path.resolve()  # Once, not per rule path
+    for relative_path_to_check in rule.paths:
+        findings.extend(
+            _run_validation_in_path(
+                repo_root_path, rule, command, relative_path_to_check
+            )
+        )
+
+    return findings
+
+
+async def run_iac_validation_command_async(
+    repo_root_path: Path,  # Absolute path to the root of the Git repository
+    rule: IaCValidationRuleItem,
+) -> List[ComplianceFinding]:
+    """
+    Async twin of `run_iac_validation_command` for callers already running an
+    event loop (e.g. the MCP server): the command is awaited instead of blocking
+    the thread, and the rule's paths are validated concurrently, at most
+    MAX_VALIDATION_WORKERS at a time.
+    """
+    findings: List[ComplianceFinding] = []
+    if not rule.enabled:
+        return findings
+
+    command = _build_validation_command(rule)
+    if command is None:
+        findings.append(_unknown_type_finding(rule))
+        return findings
+
+    repo_root_path = repo_root_path.resolve()  # Once, not per rule path
+    semaphore = asyncio.Semaphore(MAX_VALIDATION_WORKERS)
+    results = await asyncio.gather(
+        *(
+            _run_validation_in_path_async(
+                repo_root_path, rule, command, path, semaphore
+            )
+            for path in rule.paths
+        )
+    )
+    for path_findings in results:
+        findings.extend(path_findings)
+
+    return findings
+
+
+def _clean_head_sha(repo_root: Path) -> Optional[str]:
+    """
+    Returns the HEAD commit sha of the repository at `repo_root`, or None if it is
+    not a Git repository or has uncommitted/untracked changes (in which case the
+    sha does not identify the files that would be validated).
+    """
+    try:
+        repo = GitUtils(str(repo_root)).repo
+        if repo.is_dirty(untracked_files=True):
+            return None
+        return repo.head.commit.hexsha
+    except Exception:  # Not a repo, no commits yet, git unavailable, ...
+        return None
+
+
+def _findings_cache_key(
+    repo_root: Path, rules: IaCValidationRules
+) -> Optional[Tuple[str, str, str]]:
+    head_sha = _clean_head_sha(repo_root)
+    if head_sha is None:
+        return None
+    rules_hash = hashlib.sha256(rules.model_dump_json().encode("utf-8")).hexdigest()
+    # The root is part of the key: clones/worktrees at the same commit differ in
+    # their absolute paths and in untracked state such as `.terraform/`.
+    return str(repo_root.resolve()), head_sha, rules_hash
+
+
 def check_iac_validations(
     repo_root_path_str: str,  # Path to the root of the Git repository being analyzed
     rules: IaCValidationRules,
+    use_cache: bool = False,
 ) -> List[ComplianceFinding]:
     """
     Runs all configured IaC validation checks.
+    Each (rule, path) pair targets an independent directory, so the validation
+    commands run concurrently. Their findings are still reported in rule/path order.
+    With `use_cache=True`, a passing run on a clean checkout is remembered for
+    FINDINGS_CACHE_TTL_SECONDS, keyed on the repo root, HEAD sha and rules config,
+    so a repeat call in the same process skips the commands. Off by default: the
+    clean-tree check costs git processes, and one-shot callers (the CLI) never hit.
+    Runs with findings are never cached: a failure may depend on gitignored state
+    (e.g. a missing `terraform init`) that the HEAD sha does not capture.
     """
     findings: List[ComplianceFinding] = []
     if not rules.enabled or not rules.rules:
@@ -142,8 +353,53 @@ def check_iac_validations(
         )
         return findings
 
+    cache_key = _findings_cache_key(repo_root, rules) if use_cache else None
+    if cache_key is not None:
+        passed_at = _FINDINGS_CACHE.get(cache_key)
+        if passed_at is not None and time.monotonic() - passed_at < FINDINGS_CACHE_TTL_SECONDS:
+            return []
+
+    findings = _run_iac_validations(repo_root, rules)
+
+    if cache_key is not None and not findings:
+        now = time.monotonic()
+        for key, passed_at in list(_FINDINGS_CACHE.items()):
+            if now - passed_at >= FINDINGS_CACHE_TTL_SECONDS:
+                del _FINDINGS_CACHE[key]  # Expired
+        _FINDINGS_CACHE[cache_key] = now
+    return findings
+
+
+def _run_iac_validations(
+    repo_root: Path, rules: IaCValidationRules
+) -> List[ComplianceFinding]:
+    """Runs every enabled (rule, path) pair of `rules` concurrently."""
+    findings: List[ComplianceFinding] = []
+    tasks = []
     for rule_item in rules.rules:
-        findings.extend(run_iac_validation_command(repo_root, rule_item))
+        if not rule_item.enabled:
+            continue
+        command = _build_validation_command(rule_item)
+        if command is None:
+            findings.append(_unknown_type_finding(rule_item))
+            continue
+        for relative_path_to_check in rule_item.paths:
+            tasks.append((rule_item, command, relative_path_to_check))
+
+    if not tasks:
+        return findings
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_VALIDATION_WORKERS, len(tasks))
+    ) as executor:
+        futures = [
+            executor.submit(
+                _run_validation_in_path, repo_root, rule_item, command, path
+            )
+            for rule_item, command, path in tasks
+        ]
+        for future in futures:
+            findings.extend(future.result())
 
     return findings
 
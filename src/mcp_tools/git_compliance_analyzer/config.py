@@ -1,11 +1,19 @@
+import logging
 import yaml
 import os
 import re
-from typing import List, Optional, Pattern, Dict
+from typing import IO, List, Optional, Pattern, Dict
 from pydantic import BaseModel, Field, field_validator, ValidationError
 
 DEFAULT_COMPLIANCE_RULES_FILENAME = ".compliance-rules.yml"
 
+logger = logging.getLogger(__name__)
+
+try:  # Prefer the libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 # --- Individual Rule Models ---
 
 
@@ -139,12 +147,42 @@ class ComplianceRuleConfig(BaseModel):
 # --- Loading Function ---
 
 
-def load_compliance_rules(config_path: Optional[str] = None) -> ComplianceRuleConfig:
+def _parse_compliance_rules(
+    config_stream: IO[str], source: str
+) -> ComplianceRuleConfig:
+    """Parses and validates compliance rules YAML read from `config_stream`."""
+    try:
+        config_data = yaml.load(config_stream, Loader=SafeLoader)
+        if not config_data:
+            logger.warning(
+                "Compliance rules file '%s' is empty. Using default rules.", source
+            )
+            return ComplianceRuleConfig()
+        return ComplianceRuleConfig(**config_data)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Error parsing YAML compliance rules file {source}: {e}")
+    except ValidationError as e:
+        raise ValueError(f"Compliance rules validation error in {source}:\n{e}")
+    except Exception as e:
+        raise ValueError(
+            f"Unexpected error loading compliance rules from {source}: {e}"
+        )
+
+
+def load_compliance_rules(
+    config_path: Optional[str] = None, config_stream: Optional[IO[str]] = None
+) -> ComplianceRuleConfig:
     """
     Loads compliance rules from a YAML file.
+    If config_stream is given, rules are read from it directly and no path lookup is done.
     If config_path is None, tries to load from '.compliance-rules.yml'.
     If no file is found or path is invalid, returns default rule configuration.
     """
+    if config_stream is not None:
+        return _parse_compliance_rules(
+            config_stream, getattr(config_stream, "name", "<stream>")
+        )
+
     actual_config_path = config_path
     if not actual_config_path:
         current_dir = os.getcwd()
@@ -163,30 +201,18 @@ def load_compliance_rules(config_path: Optional[str] = None) -> ComplianceRuleCo
     if actual_config_path and os.path.exists(actual_config_path):
         print(f"Loading compliance rules from: {actual_config_path}")
         try:
-            with open(actual_config_path, "r") as f:
-                config_data = yaml.safe_load(f)
-            if config_data is None:
-                print(
-                    f"Warning: Compliance rules file '{actual_config_path}' is empty. Using default rules."
-                )
-                return ComplianceRuleConfig()
-            return ComplianceRuleConfig(**config_data)
-        except yaml.YAMLError as e:
-            raise ValueError(
-                f"Error parsing YAML compliance rules file {actual_config_path}: {e}"
-            )
-        except ValidationError as e:
-            raise ValueError(
-                f"Compliance rules validation error in {actual_config_path}:\n{e}"
-            )
-        except Exception as e:
+            f = open(actual_config_path, "r")
+        except OSError as e:
             raise ValueError(
                 f"Unexpected error loading compliance rules from {actual_config_path}: {e}"
             )
+        with f:
+            return _parse_compliance_rules(f, actual_config_path)
     else:
         if config_path:
-            print(
-                f"Warning: Compliance rules file '{config_path}' not found. Using default rules."
+            logger.warning(
+                "Compliance rules file '%s' not found. Using default rules.",
+                config_path,
             )
         else:
             print(
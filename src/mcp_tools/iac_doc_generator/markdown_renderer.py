@@ -10,24 +10,71 @@ from .models import (
 from typing import List, Any  # Added Any
 
 
-def format_value(value: Any) -> str:
-    """Helper to format default values or other complex values for display."""
+# Longer list/dict representations are cut off at this many characters.
+_FORMAT_TRUNCATE_AT = 50
+
+
+def _format_scalar(value: Any) -> str:
+    return f"`{value}`"
+
+
+def _format_null(value: None) -> str:
+    return "`null`"  # or "Not set" or ""
+
+
+def _format_collection(value: Any) -> str:
+    # For lists or dicts, show a compact representation, truncating long ones
+    text = str(value)
+    if len(text) > _FORMAT_TRUNCATE_AT:
+        return f"`{text[:_FORMAT_TRUNCATE_AT]}...`"
+    return f"`{text}`"
+
+
+def _format_other(value: Any) -> str:
+    # Slow path for subclasses of the dispatched types (e.g. str-based enums)
     if isinstance(value, (str, int, float, bool)):
-        return f"`{value}`"
-    if value is None:
-        return "`null`"  # or "Not set" or ""
-    # For lists or dicts, show a compact representation or placeholder
-    if isinstance(value, list):
-        if not value:
-            return "`[]`"
-        return f"`{str(value)[:50]}{'...' if len(str(value)) > 50 else ''}`"  # Truncate long lists
-    if isinstance(value, dict):
-        if not value:
-            return "`{}`"
-        return f"`{str(value)[:50]}{'...' if len(str(value)) > 50 else ''}`"  # Truncate long dicts
+        return _format_scalar(value)
+    if isinstance(value, (list, dict)):
+        return _format_collection(value)
     return f"`{type(value).__name__}` (Complex Value)"
 
 
+# Exact-type dispatch: one dict lookup instead of an isinstance cascade per call.
+_VALUE_FORMATTERS = {
+    str: _format_scalar,
+    int: _format_scalar,
+    float: _format_scalar,
+    bool: _format_scalar,
+    type(None): _format_null,
+    list: _format_collection,
+    dict: _format_collection,
+}
+
+
+def format_value(value: Any) -> str:
+    """Helper to format default values or other complex values for display."""
+    return _VALUE_FORMATTERS.get(type(value), _format_other)(value)
+
+
+# Escapes pipes and folds line breaks so free text fits in one table cell.
+_MD_CELL_TABLE = str.maketrans({"|": "\\|", "\n": " <br> ", "\r": ""})
+
+
+def _md_cell(text: str) -> str:
+    """Escapes `text` for use inside a Markdown table cell, in a single pass."""
+    return text.translate(_MD_CELL_TABLE)
+
+
+# Section line templates, filled from pre-sorted field tuples. Only the data
+# varies between renders, so each section is one join over str.format calls.
+_VARIABLE_ROW = "| `{0}` | {1} | `{2}` | {3} | `{4}` |"
+_OUTPUT_ROW = "| `{0}` | {1} | `{2}` |"
+_RESOURCE_ITEM = "- **`{0}.{1}`**"
+_MODULE_CALL_ITEM = "- **`{0}`** (Source: `{1}`)"
+_PROVIDER_ITEM = "- `{0}`"
+_ALIASED_PROVIDER_ITEM = "- `{0}` (alias: `{1}`)"
+
+
 class MarkdownRenderer:
     def __init__(self, module_doc: TerraformModuleProcessedDoc):
         self.module_doc = module_doc
@@ -40,36 +87,49 @@ class MarkdownRenderer:
         self.lines.append(f"{'#' * level} {text}")
         self._add_line()
 
+    def _add_table_row(self, *cells: str):
+        self.lines.append("| " + " | ".join(cells) + " |")
+
     def _render_variables(self, variables: List[TerraformVariableDoc]):
         if not variables:
             return
         self._add_header(3, "Variables")
-        self._add_line("| Name | Description | Type | Default | Sensitive |")
+        self._add_table_row("Name", "Description", "Type", "Default", "Sensitive")
         self._add_line("|------|-------------|------|---------|-----------|")
-        for var in sorted(variables, key=lambda v: v.name):
-            desc = var.description or "N/A"
-            # Escape pipe characters in description for table rendering
-            desc = desc.replace("|", "\\|").replace("\n", " <br> ")
-
-            default_val_str = (
-                format_value(var.default) if var.default is not None else "*(Required)*"
-            )
-
-            self._add_line(
-                f"| `{var.name}` | {desc} | `{var.type or 'any'}` | {default_val_str} | `{var.is_sensitive}` |"
-            )
+        rows = sorted(
+            (
+                (
+                    var.name,
+                    _md_cell(var.description or "N/A"),
+                    var.type or "any",
+                    (
+                        format_value(var.default)
+                        if var.default is not None
+                        else "*(Required)*"
+                    ),
+                    var.is_sensitive,
+                )
+                for var in variables
+            ),
+            key=lambda row: row[0],
+        )
+        self._add_line("\n".join(_VARIABLE_ROW.format(*row) for row in rows))
         self._add_line()
 
     def _render_outputs(self, outputs: List[TerraformOutputDoc]):
         if not outputs:
             return
         self._add_header(3, "Outputs")
-        self._add_line("| Name | Description | Sensitive |")
+        self._add_table_row("Name", "Description", "Sensitive")
         self._add_line("|------|-------------|-----------|")
-        for out in sorted(outputs, key=lambda o: o.name):
-            desc = out.description or "N/A"
-            desc = desc.replace("|", "\\|").replace("\n", " <br> ")
-            self._add_line(f"| `{out.name}` | {desc} | `{out.is_sensitive}` |")
+        rows = sorted(
+            (
+                (out.name, _md_cell(out.description or "N/A"), out.is_sensitive)
+                for out in outputs
+            ),
+            key=lambda row: row[0],
+        )
+        self._add_line("\n".join(_OUTPUT_ROW.format(*row) for row in rows))
         self._add_line()
 
     def _render_resources(self, resources: List[TerraformResourceDoc]):
@@ -77,27 +137,34 @@ class MarkdownRenderer:
             return
         self._add_header(3, "Managed Resources")
         # Could group by type or just list
-        for res in sorted(resources, key=lambda r: (r.resource_type, r.resource_name)):
-            self._add_line(f"- **`{res.resource_type}.{res.resource_name}`**")
-            # Future: Add more details like key attributes if extracted by parser
+        # Future: Add more details like key attributes if extracted by parser
+        rows = sorted((res.resource_type, res.resource_name) for res in resources)
+        self._add_line("\n".join(_RESOURCE_ITEM.format(*row) for row in rows))
         self._add_line()
 
     def _render_module_calls(self, module_calls: List[TerraformModuleCallDoc]):
         if not module_calls:
             return
         self._add_header(3, "Module Calls")
-        for mc in sorted(module_calls, key=lambda m: m.module_name):
-            self._add_line(f"- **`{mc.module_name}`** (Source: `{mc.source}`)")
-            # Future: List key arguments passed to the module
+        # Future: List key arguments passed to the module
+        rows = sorted(
+            ((mc.module_name, mc.source) for mc in module_calls),
+            key=lambda row: row[0],
+        )
+        self._add_line("\n".join(_MODULE_CALL_ITEM.format(*row) for row in rows))
         self._add_line()
 
     def _render_providers(self, providers: List[TerraformProviderDoc]):
         if not providers:
             return
         self._add_header(3, "Providers")
-        for p in sorted(providers, key=lambda x: (x.name, x.alias or "")):
-            alias_str = f" (alias: `{p.alias}`)" if p.alias else ""
-            self._add_line(f"- `{p.name}`{alias_str}")
+        rows = sorted((p.name, p.alias or "") for p in providers)
+        self._add_line(
+            "\n".join(
+                (_ALIASED_PROVIDER_ITEM if alias else _PROVIDER_ITEM).format(name, alias)
+                for name, alias in rows
+            )
+        )
         self._add_line()
 
     def render_file_doc(self, file_doc: TerraformFileDoc):
@@ -55,6 +55,25 @@ class TerraformFileDoc(BaseModel):
     providers: List[TerraformProviderDoc] = Field(default_factory=list)
     # data_sources: List[...] # Future
 
+    # Lookup indexes, rebuilt on access so they track appends to the lists above.
+    # Plain properties (not computed fields) keep them out of serialized output.
+    @property
+    def variables_by_name(self) -> Dict[str, TerraformVariableDoc]:
+        return {v.name: v for v in self.variables}
+
+    @property
+    def outputs_by_name(self) -> Dict[str, TerraformOutputDoc]:
+        return {o.name: o for o in self.outputs}
+
+    @property
+    def resources_by_key(self) -> Dict[str, TerraformResourceDoc]:
+        """Resources keyed on their Terraform address, e.g. 'aws_instance.web'."""
+        return {f"{r.resource_type}.{r.resource_name}": r for r in self.resources}
+
+    @property
+    def module_calls_by_name(self) -> Dict[str, TerraformModuleCallDoc]:
+        return {m.module_name: m for m in self.module_calls}
+
 
 class TerraformModuleProcessedDoc(BaseModel):
     """Represents combined documentation for a Terraform module (directory)."""
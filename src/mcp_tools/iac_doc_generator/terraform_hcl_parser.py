@@ -1,4 +1,7 @@
+import copy
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import hcl2  # Changed import
@@ -40,43 +43,38 @@ def _extract_string_or_first_from_list(value: Any) -> Optional[str]:
     return None
 
 
-def parse_hcl_file_content(hcl_content: str, file_path_str: str) -> TerraformFileDoc:
+def _parse_hcl(hcl_content: str) -> Dict[str, Any]:
     """
-    Parses the content of a single HCL (.tf) file.
+    Parses raw HCL2 text into python-hcl2's dict-of-lists structure.
+
+    All HCL parsing goes through this adapter so the backend can be swapped
+    (e.g. for a native-code parser emitting the same structure) or monkeypatched
+    in tests without touching the `_extract_*`/doc-building code below.
+    Raises the backend's exception on invalid syntax.
+
+    python-hcl2 (4.x) already compiles its Lark grammar once per process and
+    reuses it for every `loads` call, so no parser instance is kept here; calling
+    hcl2's internal parser directly would only tie us to its private layout.
     """
-    file_doc = TerraformFileDoc(file_path=file_path_str)
+    return hcl2.loads(hcl_content)  # type: ignore
 
-    try:
-        # Use hcl2.loads() for parsing a string
-        parsed_data = hcl2.loads(hcl_content)  # type: ignore
-        if not parsed_data:
-            return file_doc  # Empty or unparsable content
-    except Exception as e:
-        print(
-            f"Warning: Could not parse HCL file {file_path_str}: {e}", file=sys.stderr
-        )
-        return file_doc  # Return with what we have, which is just the path
 
-    # Top-level comments for file description (heuristic, not robust)
-    # This part is very basic. Real comment parsing would need more advanced logic.
-    # if hcl_content.startswith("#") or hcl_content.startswith("/*"):
-    #    first_lines = hcl_content.split('\n', 5)
-    #    potential_desc_lines = []
-    #    for line in first_lines:
-    #        if line.strip().startswith("#"):
-    #            potential_desc_lines.append(line.strip().lstrip('#').strip())
-    #        elif line.strip().startswith("/*") and "*/" in line: # Simple single line block
-    #            potential_desc_lines.append(line.split("/*")[1].split("*/")[0].strip())
-    #            break
-    #        elif line.strip().startswith("/*"): # Start of multi-line
-    #             # This simple check doesn't handle multi-line block comments well.
-    #            break
-    #        else: # First non-comment line
-    #            break
-    #    if potential_desc_lines:
-    #        file_doc.description = "\n".join(potential_desc_lines)
+# Top-level block types that parse_hcl_file_content turns into docs.
+_DOCUMENTED_BLOCK_TYPES = frozenset(
+    {"variable", "output", "resource", "module", "provider"}
+)
+
 
+def _parse_warning(file_path_str: str, error: Any) -> str:
+    return f"Warning: Could not parse HCL file {file_path_str}: {error}"
+
+
+def _build_file_doc(parsed_data: Dict[str, Any], file_path_str: str) -> TerraformFileDoc:
+    """Builds the doc for one file from its parsed HCL (see `_parse_hcl`)."""
+    file_doc = TerraformFileDoc(file_path=file_path_str)
     for block_type, blocks_of_that_type in parsed_data.items():
+        if block_type not in _DOCUMENTED_BLOCK_TYPES:
+            continue  # e.g. locals, data, terraform: skip without visiting instances
         if not isinstance(blocks_of_that_type, list):
             continue  # Should always be a list of blocks
 
@@ -96,7 +94,9 @@ def parse_hcl_file_content(hcl_content: str, file_path_str: str) -> TerraformFil
                                 var_body.get("type")
                             ),
                             description=_extract_description_from_block_body(var_body),
-                            default=var_body.get("default"),  # Default can be complex
+                            # Default can be complex; copied so files with the
+                            # same content never share one parse result's default.
+                            default=copy.deepcopy(var_body.get("default")),
                             is_sensitive=var_body.get("sensitive", False),
                         )
                     )
@@ -165,11 +165,92 @@ def parse_hcl_file_content(hcl_content: str, file_path_str: str) -> TerraformFil
     return file_doc
 
 
+def parse_hcl_file_content(
+    hcl_content: str,
+    file_path_str: str,
+    warnings_out: Optional[List[str]] = None,
+) -> TerraformFileDoc:
+    """
+    Parses the content of a single HCL (.tf) file.
+    Warnings are appended to `warnings_out` if given, else printed to stderr.
+    """
+    file_doc = TerraformFileDoc(file_path=file_path_str)
+    if not hcl_content or hcl_content.isspace():
+        return file_doc  # Empty scaffolding file; nothing to parse
+
+    try:
+        parsed_data = _parse_hcl(hcl_content)
+        if not parsed_data:
+            return file_doc  # Empty or unparsable content
+    except Exception as e:
+        warning = _parse_warning(file_path_str, e)
+        if warnings_out is not None:
+            warnings_out.append(warning)
+        else:
+            print(warning, file=sys.stderr)
+        return file_doc  # Return with what we have, which is just the path
+
+    # Top-level comments for file description (heuristic, not robust)
+    # This part is very basic. Real comment parsing would need more advanced logic.
+    # if hcl_content.startswith("#") or hcl_content.startswith("/*"):
+    #    first_lines = hcl_content.split('\n', 5)
+    #    potential_desc_lines = []
+    #    for line in first_lines:
+    #        if line.strip().startswith("#"):
+    #            potential_desc_lines.append(line.strip().lstrip('#').strip())
+    #        elif line.strip().startswith("/*") and "*/" in line: # Simple single line block
+    #            potential_desc_lines.append(line.split("/*")[1].split("*/")[0].strip())
+    #            break
+    #        elif line.strip().startswith("/*"): # Start of multi-line
+    #             # This simple check doesn't handle multi-line block comments well.
+    #            break
+    #        else: # First non-comment line
+    #            break
+    #    if potential_desc_lines:
+    #        file_doc.description = "\n".join(potential_desc_lines)
+
+    return _build_file_doc(parsed_data, file_path_str)
+
+
+# Below this many distinct .tf files, process start-up costs more than it saves.
+MIN_FILES_FOR_POOL = 4
+
+# With this many .tf files or more, file reads are issued from a thread pool so
+# they overlap instead of waiting on each other; MAX_READ_WORKERS bounds the pool.
+MIN_FILES_FOR_CONCURRENT_READ = 8
+MAX_READ_WORKERS = 16
+
+
+def _read_tf_file(file_path: str) -> Tuple[Optional[str], Optional[Exception]]:
+    """Reads one .tf file, returning its content or the error that occurred."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return f.read(), None
+    except Exception as e:
+        return None, e
+
+
+def _parse_worker(hcl_content: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Parses raw HCL, in a worker process or in-process. Returns the parsed data,
+    or the error message on failure (parser exceptions are not reliably picklable).
+    """
+    try:
+        return _parse_hcl(hcl_content), None
+    except Exception as e:
+        return None, str(e)
+
+
 def parse_terraform_module_directory(
     module_dir_path: str,
 ) -> TerraformModuleProcessedDoc:
     """
     Parses all .tf files in a given directory (Terraform module) and aggregates results.
+    Files are read on the calling process. Files with identical content (e.g.
+    copied versions.tf boilerplate) are parsed once; with MIN_FILES_FOR_POOL or
+    more distinct files, parsing is spread across a process pool (at most one
+    worker per file or CPU) since it is CPU-bound.
+    Warnings are collected and written to stderr in one go at the end.
     """
     module_path_obj = Path(module_dir_path)
     if not module_path_obj.is_dir():
@@ -182,16 +263,62 @@ def parse_terraform_module_directory(
     # For now, if a 'main.tf' has a leading comment, we might use it.
     # Or if a 'README.md' (or similar) exists in the module_dir_path.
 
-    for tf_file_path_obj in module_path_obj.glob("*.tf"):
+    # os.scandir's DirEntry caches the type info from the directory listing, so
+    # filtering costs no extra stat calls. Symlinked .tf files are followed.
+    with os.scandir(module_path_obj) as dir_entries:
+        tf_entries = [
+            entry
+            for entry in dir_entries
+            if entry.name.endswith(".tf") and entry.is_file()
+        ]
+
+    tf_paths = [entry.path for entry in tf_entries]
+    if len(tf_paths) >= MIN_FILES_FOR_CONCURRENT_READ:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_READ_WORKERS, len(tf_paths))
+        ) as executor:
+            read_results = list(executor.map(_read_tf_file, tf_paths))
+    else:
+        read_results = [_read_tf_file(path) for path in tf_paths]
+
+    warnings: List[str] = []
+    payloads: List[Tuple[str, str]] = []
+    for tf_entry, (content, error) in zip(tf_entries, read_results):
+        if content is None:
+            warnings.append(f"Error processing file {tf_entry.path}: {error}")
+            continue
+        payloads.append((content, tf_entry.name))  # Relative name
+
+    # Parse each distinct content once; results only live for this call.
+    unique_contents = list(
+        dict.fromkeys(content for content, _ in payloads if content.strip())
+    )
+    if len(unique_contents) >= MIN_FILES_FOR_POOL:
+        with ProcessPoolExecutor(
+            max_workers=min(len(unique_contents), os.cpu_count() or 1)
+        ) as executor:
+            parse_results = dict(
+                zip(unique_contents, executor.map(_parse_worker, unique_contents))
+            )
+    else:
+        parse_results = {
+            content: _parse_worker(content) for content in unique_contents
+        }
+
+    for content, file_name in payloads:
         try:
-            with open(tf_file_path_obj, "r", encoding="utf-8") as f:
-                content = f.read()
-            file_doc = parse_hcl_file_content(
-                content, str(tf_file_path_obj.name)
-            )  # Pass relative name
-            module_doc.files.append(file_doc)
+            parsed_data, parse_error = parse_results.get(content, (None, None))
+            if parse_error is not None:
+                warnings.append(_parse_warning(file_name, parse_error))
+            if parsed_data:
+                module_doc.files.append(_build_file_doc(parsed_data, file_name))
+            else:
+                module_doc.files.append(TerraformFileDoc(file_path=file_name))
         except Exception as e:
-            print(f"Error processing file {tf_file_path_obj}: {e}", file=sys.stderr)
+            warnings.append(f"Error processing file {file_name}: {e}")
+
+    if warnings:
+        sys.stderr.write("\n".join(warnings) + "\n")
 
     return module_doc
 
@@ -1,4 +1,5 @@
-from typing import List, Dict, Any, Optional, Set
+import functools
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
 from ..models import ParsedResource, DriftInfo, DriftType, AttributeDrift
 import sys
 
@@ -28,6 +29,30 @@ DEFAULT_IGNORED_ATTRIBUTES: Dict[str, List[str]] = {
     # Add more resource types and their commonly noisy/dynamic attributes
 }
 
+# Frozen once at import so per-key membership checks in compare_attributes are
+# set lookups rather than list scans.
+_DEFAULT_IGNORED_FROZEN: Dict[str, FrozenSet[str]] = {
+    resource_type: frozenset(attrs)
+    for resource_type, attrs in DEFAULT_IGNORED_ATTRIBUTES.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _frozen_ignored(attribute_names: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset(attribute_names)
+
+
+def _resolve_ignored_attributes(
+    resource_type: str, ignored_attributes_config: Optional[Dict[str, List[str]]]
+) -> FrozenSet[str]:
+    """
+    The attribute names to skip for `resource_type`. A non-empty config replaces
+    the defaults entirely, as before; its per-type lists are memoized as frozensets.
+    """
+    if not ignored_attributes_config:
+        return _DEFAULT_IGNORED_FROZEN.get(resource_type, frozenset())
+    return _frozen_ignored(tuple(ignored_attributes_config.get(resource_type, ())))
+
 
 def compare_attributes(
     iac_attrs: Dict[str, Any],
@@ -50,9 +75,9 @@ def compare_attributes(
     """
     drifts: List[AttributeDrift] = []
 
-    current_ignored_attributes = (
-        ignored_attributes_config or DEFAULT_IGNORED_ATTRIBUTES
-    ).get(resource_type, [])
+    current_ignored_attributes = _resolve_ignored_attributes(
+        resource_type, ignored_attributes_config
+    )
     # Add 'id' to ignored attributes as it's used for matching, not for diffing content.
     # Also, some attributes in TF state are computed/internal and start with '_' or are complex objects not meant for direct diff.
     # This simple diff won't handle nested structures well without more logic.
@@ -107,6 +132,14 @@ def compare_attributes(
     return drifts
 
 
+def build_resource_index(resources: List[ParsedResource]) -> Dict[str, ParsedResource]:
+    """
+    Indexes resources by their `id` for O(1) lookup. Resources without an id are
+    skipped; if ids repeat, the last resource wins.
+    """
+    return {res.id: res for res in resources if res.id}
+
+
 def compare_states(
     iac_resources: List[ParsedResource],
     actual_resources: List[ParsedResource],
@@ -127,12 +160,9 @@ def compare_states(
 
     # Create dictionaries for quick lookup by resource ID (actual cloud ID)
     # This assumes `res.id` from iac_resources is the *actual cloud ID* stored in tfstate.
-    iac_by_id: Dict[str, ParsedResource] = {
-        res.id: res for res in iac_resources if res.id
-    }
-    actual_by_id: Dict[str, ParsedResource] = {
-        res.id: res for res in actual_resources if res.id
-    }
+    # Each list is indexed exactly once; both passes below only do dict lookups.
+    iac_by_id = build_resource_index(iac_resources)
+    actual_by_id = build_resource_index(actual_resources)
 
     # --- Check for MODIFIED and MISSING_IN_ACTUAL resources ---
     for iac_res_id, iac_res in iac_by_id.items():
@@ -190,13 +220,11 @@ def compare_states(
             )
 
     # --- Check for UNMANAGED_IN_ACTUAL resources ---
-    # Resources in actual state but not tracked by (or missing from) IaC state
-    actual_ids_processed: Set[str] = set(
-        iac_by_id.keys()
-    )  # IDs that were matched or found missing
-
+    # Resources in actual state but not tracked by (or missing from) IaC state.
+    # Every IaC id was matched or reported missing above, so iac_by_id doubles as
+    # the set of processed ids.
     for actual_res_id, actual_res in actual_by_id.items():
-        if actual_res_id not in actual_ids_processed:
+        if actual_res_id not in iac_by_id:
             drift_results.append(
                 DriftInfo(
                     drift_type=DriftType.UNMANAGED_IN_ACTUAL,
@@ -1,9 +1,13 @@
 import json
+import logging
+import os
 from typing import List, Dict, Any, Optional, Union
 
 # No longer need BaseModel, Field, validator directly here if ParsedResource is self-contained
 from ..models import ParsedResource  # Import from shared models
 
+logger = logging.getLogger(__name__)
+
 # --- Terraform State Parser ---
 
 
@@ -22,18 +26,29 @@ def parse_terraform_state_file(file_path: str) -> List[ParsedResource]:
         with open(file_path, "r") as f:
             state_data = json.load(f)
     except FileNotFoundError:
-        print(f"Error: Terraform state file not found at {file_path}", file=sys.stderr)
+        logger.error("Error: Terraform state file not found at %s", file_path)
         return []
     except json.JSONDecodeError as e:
-        print(
-            f"Error: Invalid JSON in Terraform state file {file_path}: {e}",
-            file=sys.stderr,
-        )
+        logger.error("Error: Invalid JSON in Terraform state file %s: %s", file_path, e)
         return []
     except Exception as e:
-        print(f"Error reading Terraform state file {file_path}: {e}", file=sys.stderr)
+        logger.error("Error reading Terraform state file %s: %s", file_path, e)
         return []
 
+    return parse_terraform_state_dict(state_data)
+
+
+def parse_terraform_state_dict(state_data: Dict[str, Any]) -> List[ParsedResource]:
+    """
+    Extracts resources from already-loaded Terraform state data (the decoded
+    contents of a .tfstate file). `state_data` is not modified.
+
+    Args:
+        state_data: The state as a dictionary.
+
+    Returns:
+        A list of ParsedResource objects (empty if no managed resources are found).
+    """
     parsed_resources: List[ParsedResource] = []
 
     # Terraform state structure can vary slightly (e.g., version 3 vs 4 format)
@@ -72,7 +87,7 @@ def parse_terraform_state_file(file_path: str) -> List[ParsedResource]:
             instance_id = instance_attributes.get("id")  # Common 'id' attribute
 
             if not instance_id or not res_type or not res_name:
-                # print(f"Warning: Skipping resource instance due to missing id, type, or name: {instance_data}", file=sys.stderr)
+                # logger.warning("Skipping resource instance due to missing id, type, or name: %s", instance_data)
                 continue
 
             # Module path if present
@@ -117,20 +132,29 @@ def parse_terraform_plan_json_file(file_path: str) -> List[Dict[str, Any]]:
         with open(file_path, "r") as f:
             plan_data = json.load(f)
     except FileNotFoundError:
-        print(
-            f"Error: Terraform plan JSON file not found at {file_path}", file=sys.stderr
-        )
+        logger.error("Error: Terraform plan JSON file not found at %s", file_path)
         return []
     except json.JSONDecodeError as e:
-        print(
-            f"Error: Invalid JSON in Terraform plan file {file_path}: {e}",
-            file=sys.stderr,
-        )
+        logger.error("Error: Invalid JSON in Terraform plan file %s: %s", file_path, e)
         return []
     except Exception as e:
-        print(f"Error reading Terraform plan file {file_path}: {e}", file=sys.stderr)
+        logger.error("Error reading Terraform plan file %s: %s", file_path, e)
         return []
 
+    return parse_terraform_plan_dict(plan_data)
+
+
+def parse_terraform_plan_dict(plan_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Extracts the resource changes from already-loaded plan JSON data
+    (see `parse_terraform_plan_json_file`).
+
+    Args:
+        plan_data: The plan as a dictionary.
+
+    Returns:
+        A list of dictionaries, one per planned resource change.
+    """
     # The structure of plan JSON is complex. We are interested in 'resource_changes'.
     resource_changes = plan_data.get("resource_changes", [])
 
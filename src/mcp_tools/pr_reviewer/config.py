@@ -9,6 +9,11 @@ from typing import List, Optional
 import yaml
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+try:  # Prefer the libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 DEFAULT_CONFIG_FILENAME = ".pr-policy.yml"
 
 # --- Policy Specific Models ---
@@ -173,7 +178,7 @@ def load_config(config_path: Optional[str] = None) -> PolicyConfig:
         print(f"Loading PR policy configuration from: {config_path}")
         try:
             with open(config_path, "r") as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=SafeLoader)
             if config_data is None:
                 print("Warning: Configuration file is empty. Using default policies.")
                 return PolicyConfig()
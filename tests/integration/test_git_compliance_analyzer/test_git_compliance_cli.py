@@ -273,10 +273,10 @@ def test_cli_compliance_rules_file_not_found(
     # print("STDOUT (rules not found):", result.stdout)
     # print("STDERR (rules not found):", result.stderr) # stderr from load_compliance_rules
 
-    # The load_compliance_rules prints warning to stdout, then CLI continues with defaults.
+    # The load_compliance_rules logs a warning (stderr), then CLI continues with defaults.
     assert (
-        "Warning: Compliance rules file 'non_existent_rules.yml' not found. Using default rules."
-        in result.stdout
+        "Compliance rules file 'non_existent_rules.yml' not found. Using default rules."
+        in result.stderr
     )
     # The outcome (returncode) depends on whether defaults cause violations.
     # As seen in test_cli_compliance_no_violations_default_rules, initial commit fails default conventional commit.
@@ -0,0 +1,110 @@
+import pytest
+from pathlib import Path
+import git  # For setting up test repos
+
+from src.mcp_tools.common.git_utils import GitUtils, GitRepoError
+
+
+@pytest.fixture
+def temp_git_repo(tmp_path: Path):
+    """
+    Creates a repository with a linear commit, a side-branch commit with a
+    multi-line message, and a merge of the two.
+    Yields the repo and its commits in creation order.
+    """
+    repo_dir = tmp_path / "git_utils_test_repo"
+    repo_dir.mkdir()
+    repo = git.Repo.init(repo_dir)
+
+    with repo.config_writer() as cw:
+        cw.set_value("user", "name", "Test User").release()
+        cw.set_value("user", "email", "test@example.com").release()
+
+    (repo_dir / "README.md").write_text("Initial README.\n")
+    repo.index.add(["README.md"])
+    initial = repo.index.commit("Initial commit: Add README")
+
+    (repo_dir / "feature.txt").write_text("feature\n")
+    repo.index.add(["feature.txt"])
+    feature = repo.index.commit(
+        "feat: add feature file\n\nFirst body paragraph.\n\nRefs: TICKET-123\n"
+    )
+
+    merge = repo.index.commit(
+        "Merge branch 'feature'\n\nMerge body line.",
+        parent_commits=[initial, feature],
+    )
+
+    yield repo_dir, [initial, feature, merge]
+
+
+def test_get_commit_details_bulk_matches_per_commit_details(temp_git_repo):
+    repo_dir, commits = temp_git_repo
+    git_utils = GitUtils(str(repo_dir))
+    shas = [c.hexsha for c in commits]
+
+    details = git_utils.get_commit_details_bulk(shas)
+
+    assert list(details) == shas
+    for commit in commits:
+        assert details[commit.hexsha] == git_utils.get_commit_details(
+            git_utils.repo.commit(commit.hexsha)
+        )
+
+    feature_details = details[commits[1].hexsha]
+    assert feature_details["message_subject"] == "feat: add feature file"
+    assert feature_details["message_body"].strip() == (
+        "First body paragraph.\n\nRefs: TICKET-123"
+    )
+    assert feature_details["author_email"] == "test@example.com"
+
+    merge_details = details[commits[2].hexsha]
+    assert merge_details["message_subject"] == "Merge branch 'feature'"
+    assert merge_details["message_body"].strip() == "Merge body line."
+    assert len(git_utils.repo.commit(commits[2].hexsha).parents) == 2
+
+
+def test_get_commit_details_bulk_accepts_commit_objects(temp_git_repo):
+    repo_dir, commits = temp_git_repo
+    git_utils = GitUtils(str(repo_dir))
+    commit_objs = list(git_utils.repo.iter_commits(commits[-1].hexsha))
+
+    details = git_utils.get_commit_details_bulk(commit_objs)
+
+    assert list(details) == [c.hexsha for c in commit_objs]
+    assert details == git_utils.get_commit_details_bulk(
+        [c.hexsha for c in commit_objs]
+    )
+
+
+def test_get_commit_details_bulk_deduplicates_and_handles_empty(temp_git_repo):
+    repo_dir, commits = temp_git_repo
+    git_utils = GitUtils(str(repo_dir))
+
+    assert git_utils.get_commit_details_bulk([]) == {}
+    details = git_utils.get_commit_details_bulk([commits[0].hexsha] * 3)
+    assert list(details) == [commits[0].hexsha]
+
+
+@pytest.mark.parametrize(
+    "bad_sha",
+    [
+        pytest.param("0" * 40, id="missing-object"),
+        pytest.param("not-a-sha", id="unresolvable-name"),
+    ],
+)
+def test_get_commit_details_bulk_missing_sha(temp_git_repo, bad_sha):
+    repo_dir, commits = temp_git_repo
+    git_utils = GitUtils(str(repo_dir))
+
+    with pytest.raises(GitRepoError, match="Invalid commit SHA"):
+        git_utils.get_commit_details_bulk([commits[0].hexsha, bad_sha])
+
+
+def test_get_commit_details_bulk_non_commit_object(temp_git_repo):
+    repo_dir, commits = temp_git_repo
+    git_utils = GitUtils(str(repo_dir))
+    tree_sha = commits[0].tree.hexsha
+
+    with pytest.raises(GitRepoError, match="Invalid commit SHA"):
+        git_utils.get_commit_details_bulk([tree_sha])
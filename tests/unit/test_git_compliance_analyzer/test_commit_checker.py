@@ -15,7 +15,7 @@ from git import Commit as GitPythonCommit  # For mocking commit objects
 def mock_git_utils_commit_checker():
     mock = MagicMock(spec=GitUtils)
     mock.get_commits_between.return_value = []
-    mock.get_commit_details.return_value = {}  # Default empty details
+    mock.get_commit_details_bulk.return_value = {}  # Default empty details
     return mock
 
 
@@ -106,7 +106,7 @@ def test_check_commit_history_all_compliant(
     mock_git_utils_commit_checker: MagicMock,
     commit_history_rules_default: CommitHistoryRules,
 ):
-    # Mock GitPython Commit objects (only need 'hexsha' for get_commit_details to be called with it)
+    # Mock GitPython Commit objects (only need 'hexsha' to look up get_commit_details_bulk results)
     mock_commit1 = MagicMock(spec=GitPythonCommit)
     mock_commit1.hexsha = "commit1sha"
     mock_commit2 = MagicMock(spec=GitPythonCommit)
@@ -116,10 +116,13 @@ def test_check_commit_history_all_compliant(
         mock_commit1,
         mock_commit2,
     ]
-    mock_git_utils_commit_checker.get_commit_details.side_effect = [
-        {"sha": "commit1sha", "message_subject": "feat: first valid commit"},
-        {"sha": "commit2sha", "message_subject": "fix(scope): second valid commit"},
-    ]
+    mock_git_utils_commit_checker.get_commit_details_bulk.return_value = {
+        "commit1sha": {"sha": "commit1sha", "message_subject": "feat: first valid commit"},
+        "commit2sha": {
+            "sha": "commit2sha",
+            "message_subject": "fix(scope): second valid commit",
+        },
+    }
     findings = commit_checker.check_commit_history(
         mock_git_utils_commit_checker, "main", "HEAD", commit_history_rules_default
     )
@@ -142,14 +145,17 @@ def test_check_commit_history_some_non_compliant(
         mock_commit2,
         mock_commit3,
     ]
-    mock_git_utils_commit_checker.get_commit_details.side_effect = [
-        {"sha": "c1", "message_subject": "feat: valid commit"},
-        {"sha": "c2", "message_subject": "INVALID subject line"},  # Non-compliant
-        {"sha": "c3", "message_subject": "chore(sub): also valid"},
-    ]
+    mock_git_utils_commit_checker.get_commit_details_bulk.return_value = {
+        "c1": {"sha": "c1", "message_subject": "feat: valid commit"},
+        "c2": {"sha": "c2", "message_subject": "INVALID subject line"},  # Non-compliant
+        "c3": {"sha": "c3", "message_subject": "chore(sub): also valid"},
+    }
     findings = commit_checker.check_commit_history(
         mock_git_utils_commit_checker, "main", "HEAD", commit_history_rules_default
     )
+    mock_git_utils_commit_checker.get_commit_details_bulk.assert_called_once_with(
+        [mock_commit1, mock_commit2, mock_commit3]
+    )
     assert len(findings) == 1
     assert findings[0].rule_id == "COMMIT_CONVENTIONAL_FORMAT_INVALID"
     assert findings[0].commit_sha == "c2"
@@ -164,9 +170,8 @@ def test_check_commit_history_rules_disabled(
     mock_commit1 = MagicMock(spec=GitPythonCommit)
     mock_commit1.hexsha = "c1"
     mock_git_utils_commit_checker.get_commits_between.return_value = [mock_commit1]
-    mock_git_utils_commit_checker.get_commit_details.return_value = {
-        "sha": "c1",
-        "message_subject": "bad commit",
+    mock_git_utils_commit_checker.get_commit_details_bulk.return_value = {
+        "c1": {"sha": "c1", "message_subject": "bad commit"}
     }
 
     findings = commit_checker.check_commit_history(
@@ -186,9 +191,8 @@ def test_check_commit_history_conventional_commit_rule_disabled(
     mock_commit1 = MagicMock(spec=GitPythonCommit)
     mock_commit1.hexsha = "c1"
     mock_git_utils_commit_checker.get_commits_between.return_value = [mock_commit1]
-    mock_git_utils_commit_checker.get_commit_details.return_value = {
-        "sha": "c1",
-        "message_subject": "bad commit",
+    mock_git_utils_commit_checker.get_commit_details_bulk.return_value = {
+        "c1": {"sha": "c1", "message_subject": "bad commit"}
     }
 
     findings = commit_checker.check_commit_history(
@@ -210,3 +214,21 @@ def test_check_commit_history_git_error(
     assert len(findings) == 1
     assert findings[0].rule_id == "GIT_COMMIT_HISTORY_ERROR"
     assert "Error retrieving commit history" in findings[0].message
+
+
+def test_check_commit_history_commit_details_error(
+    mock_git_utils_commit_checker: MagicMock,
+    commit_history_rules_default: CommitHistoryRules,
+):
+    mock_commit1 = MagicMock(spec=GitPythonCommit)
+    mock_commit1.hexsha = "c1"
+    mock_git_utils_commit_checker.get_commits_between.return_value = [mock_commit1]
+    mock_git_utils_commit_checker.get_commit_details_bulk.side_effect = GitRepoError(
+        "Invalid commit SHA"
+    )
+    findings = commit_checker.check_commit_history(
+        mock_git_utils_commit_checker, "main", "HEAD", commit_history_rules_default
+    )
+    assert len(findings) == 1
+    assert findings[0].rule_id == "GIT_COMMIT_HISTORY_ERROR"
+    assert "Error reading commit details" in findings[0].message
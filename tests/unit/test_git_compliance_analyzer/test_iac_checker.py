@@ -1,5 +1,7 @@
+import asyncio
+
 import pytest
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import ANY, AsyncMock, MagicMock, patch, call
 from pathlib import Path
 
 from src.mcp_tools.git_compliance_analyzer.models import ComplianceFinding
@@ -27,17 +29,26 @@ def temp_repo_path(tmp_path: Path) -> Path:
     return repo_root
 
 
+def fake_completed_run(returncode: int, stdout: str = "", stderr: str = ""):
+    """subprocess.run stand-in that writes output to the files the checker passes."""
+
+    def run(cmd, **kwargs):
+        kwargs["stdout"].write(stdout.encode())
+        kwargs["stderr"].write(stderr.encode())
+        return MagicMock(returncode=returncode)
+
+    return run
+
+
 # --- Tests for run_iac_validation_command ---
 
 
 def test_run_iac_validation_command_terraform_validate_success(
     mock_subprocess_run: MagicMock, temp_repo_path: Path
 ):
-    mock_process = MagicMock()
-    mock_process.returncode = 0
-    mock_process.stdout = "Terraform validation successful."
-    mock_process.stderr = ""
-    mock_subprocess_run.return_value = mock_process
+    mock_subprocess_run.side_effect = fake_completed_run(
+        0, stdout="Terraform validation successful."
+    )
 
     rule = IaCValidationRuleItem(
         type="terraform_validate", paths=["infra"], severity="High", enabled=True
@@ -46,25 +57,23 @@ def test_run_iac_validation_command_terraform_validate_success(
 
     assert not findings
     expected_cmd = ["terraform", "validate", "-no-color"]
-    # Check that subprocess.run was called in the correct directory
-    # The call object's args[0] is the command list, kwargs['cwd'] is the directory.
-    # This is a bit tricky as os.chdir is used. We can check call_args.
-    # For simplicity here, let's assume if it didn't error on path, chdir worked.
-    # A more robust test might mock os.chdir and os.getcwd.
+    # The command runs with cwd= set to the target directory (no process-wide chdir).
+    # Output is redirected to temp files rather than captured through pipes.
     mock_subprocess_run.assert_called_once_with(
-        expected_cmd, capture_output=True, text=True, check=False
+        expected_cmd,
+        stdout=ANY,
+        stderr=ANY,
+        check=False,
+        cwd=(temp_repo_path / "infra").resolve(),
     )
-    # To check CWD, you'd need to mock os.chdir and assert it was called with temp_repo_path / "infra"
 
 
 def test_run_iac_validation_command_terraform_validate_failure(
     mock_subprocess_run: MagicMock, temp_repo_path: Path
 ):
-    mock_process = MagicMock()
-    mock_process.returncode = 1
-    mock_process.stdout = ""
-    mock_process.stderr = "Error: Invalid configuration."
-    mock_subprocess_run.return_value = mock_process
+    mock_subprocess_run.side_effect = fake_completed_run(
+        1, stderr="Error: Invalid configuration."
+    )
 
     rule = IaCValidationRuleItem(
         type="terraform_validate", paths=["infra"], severity="High", enabled=True
@@ -112,10 +121,8 @@ def test_run_iac_validation_command_path_not_dir(temp_repo_path: Path):
 
 
 def test_run_iac_validation_command_path_outside_repo(temp_repo_path: Path):
-    # Create a path that tries to go outside. Use absolute path for outside.
-    # Or relative like ../../outside_dir
-    # The check is `repo_root_path not in check_dir_abs.parents and check_dir_abs != repo_root_path`
-    # So, `../` from repo_root will fail this.
+    # A relative path that climbs out of the repo. The checker resolve()s it and
+    # requires `check_dir_abs.is_relative_to(repo_root_path)`, so `../` fails.
     rule = IaCValidationRuleItem(
         type="terraform_validate", paths=["../outside_repo_sim"], enabled=True
     )
@@ -124,6 +131,22 @@ def test_run_iac_validation_command_path_outside_repo(temp_repo_path: Path):
     assert findings[0].rule_id == "IAC_VALIDATION_PATH_OUTSIDE_REPO"
 
 
+def test_run_iac_validation_command_symlink_outside_repo(
+    mock_subprocess_run: MagicMock, temp_repo_path: Path
+):
+    outside_dir = temp_repo_path.parent / "outside_target"
+    outside_dir.mkdir()
+    (temp_repo_path / "escape").symlink_to(outside_dir, target_is_directory=True)
+
+    rule = IaCValidationRuleItem(
+        type="terraform_validate", paths=["escape"], enabled=True
+    )
+    findings = iac_checker.run_iac_validation_command(temp_repo_path, rule)
+    assert len(findings) == 1
+    assert findings[0].rule_id == "IAC_VALIDATION_PATH_OUTSIDE_REPO"
+    mock_subprocess_run.assert_not_called()
+
+
 def test_run_iac_validation_command_rule_disabled(
     mock_subprocess_run: MagicMock, temp_repo_path: Path
 ):
@@ -135,16 +158,107 @@ def test_run_iac_validation_command_rule_disabled(
     mock_subprocess_run.assert_not_called()
 
 
+def test_run_iac_validation_command_async_failure(temp_repo_path: Path):
+    mock_process = MagicMock(returncode=1)
+    mock_process.communicate = AsyncMock(
+        return_value=(b"", b"Error: Invalid configuration.")
+    )
+
+    rule = IaCValidationRuleItem(
+        type="terraform_validate",
+        paths=["infra", "modules/module_a"],
+        severity="High",
+        enabled=True,
+    )
+    with patch(
+        "asyncio.create_subprocess_exec", AsyncMock(return_value=mock_process)
+    ) as mock_exec:
+        findings = asyncio.run(
+            iac_checker.run_iac_validation_command_async(temp_repo_path, rule)
+        )
+
+    assert mock_exec.call_count == 2
+    assert mock_exec.call_args_list[0].args == ("terraform", "validate", "-no-color")
+    assert mock_exec.call_args_list[0].kwargs["cwd"] == str(
+        (temp_repo_path / "infra").resolve()
+    )
+    # Findings keep the order of rule.paths
+    assert [f.file_path for f in findings] == ["infra", "modules/module_a"]
+    assert findings[0].rule_id == "TERRAFORM_VALIDATE_FAILED"
+    assert "Error: Invalid configuration." in findings[0].details["stderr"]  # type: ignore
+
+
+def test_run_iac_validation_command_async_bounded_concurrency(
+    temp_repo_path: Path, monkeypatch
+):
+    monkeypatch.setattr(iac_checker, "MAX_VALIDATION_WORKERS", 2)
+    paths = [f"stack_{i}" for i in range(5)]
+    for path in paths:
+        (temp_repo_path / path).mkdir()
+
+    running = 0
+    max_running = 0
+
+    async def fake_exec(*args, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+
+        async def communicate():
+            nonlocal running
+            await asyncio.sleep(0.01)
+            running -= 1
+            return b"", b""
+
+        return MagicMock(returncode=0, communicate=communicate)
+
+    rule = IaCValidationRuleItem(type="terraform_validate", paths=paths, enabled=True)
+    with patch("asyncio.create_subprocess_exec", side_effect=fake_exec) as mock_exec:
+        findings = asyncio.run(
+            iac_checker.run_iac_validation_command_async(temp_repo_path, rule)
+        )
+
+    assert not findings
+    assert mock_exec.call_count == 5
+    assert max_running == 2
+
+
+def test_run_iac_validation_command_async_cmd_not_found(temp_repo_path: Path):
+    rule = IaCValidationRuleItem(
+        type="terraform_validate", paths=["infra"], enabled=True
+    )
+    with patch(
+        "asyncio.create_subprocess_exec",
+        AsyncMock(side_effect=FileNotFoundError("terraform command not found")),
+    ):
+        findings = asyncio.run(
+            iac_checker.run_iac_validation_command_async(temp_repo_path, rule)
+        )
+
+    assert len(findings) == 1
+    assert findings[0].rule_id == "TERRAFORM_VALIDATE_CMD_NOT_FOUND"
+
+
 # --- Tests for check_iac_validations (orchestrator) ---
 
 
 def test_check_iac_validations_multiple_rules(
     mock_subprocess_run: MagicMock, temp_repo_path: Path
 ):
-    # First rule success, second rule failure
-    mock_success = MagicMock(returncode=0, stdout="Success", stderr="")
-    mock_failure = MagicMock(returncode=1, stdout="", stderr="Failure in module_a")
-    mock_subprocess_run.side_effect = [mock_success, mock_failure]
+    # First rule success, second rule failure. Rules run concurrently, so the
+    # result is chosen by the cwd= each call receives rather than call order.
+    results_by_cwd = {
+        (temp_repo_path / "infra").resolve(): fake_completed_run(0, stdout="Success"),
+        (temp_repo_path / "modules" / "module_a").resolve(): fake_completed_run(
+            1, stderr="Failure in module_a"
+        ),
+    }
+
+    def run_in_cwd(cmd, **kwargs):
+        assert kwargs["cwd"] in results_by_cwd
+        return results_by_cwd[kwargs["cwd"]](cmd, **kwargs)
+
+    mock_subprocess_run.side_effect = run_in_cwd
 
     rules_config = IaCValidationRules(
         rules=[
@@ -201,3 +315,99 @@ def test_check_iac_validations_invalid_repo_path():
     assert len(findings) == 1
     assert findings[0].rule_id == "IAC_VALIDATION_REPO_PATH_INVALID"
     assert "Repository path for IaC validation is invalid" in findings[0].message
+
+
+def test_check_iac_validations_cached_per_root_head_and_rules(
+    mock_subprocess_run: MagicMock, temp_repo_path: Path, tmp_path: Path, monkeypatch
+):
+    monkeypatch.setattr(iac_checker, "_FINDINGS_CACHE", {})
+    monkeypatch.setattr(iac_checker, "_clean_head_sha", lambda repo_root: "abc123")
+    mock_subprocess_run.side_effect = fake_completed_run(0)
+
+    rules_config = IaCValidationRules(
+        rules=[IaCValidationRuleItem(type="terraform_validate", paths=["infra"])],
+        enabled=True,
+    )
+
+    first = iac_checker.check_iac_validations(str(temp_repo_path), rules_config, use_cache=True)
+    second = iac_checker.check_iac_validations(str(temp_repo_path), rules_config, use_cache=True)
+    assert mock_subprocess_run.call_count == 1
+    assert first == second == []
+
+    # A different rules config is a cache miss
+    other_rules_config = IaCValidationRules(
+        rules=[
+            IaCValidationRuleItem(
+                type="terraform_validate", paths=["infra"], severity="Low"
+            )
+        ],
+        enabled=True,
+    )
+    iac_checker.check_iac_validations(str(temp_repo_path), other_rules_config, use_cache=True)
+    assert mock_subprocess_run.call_count == 2
+
+    # So is another checkout at the same commit
+    other_clone = tmp_path / "other_clone"
+    (other_clone / "infra").mkdir(parents=True)
+    iac_checker.check_iac_validations(str(other_clone), rules_config, use_cache=True)
+    assert mock_subprocess_run.call_count == 3
+
+
+def test_check_iac_validations_failures_not_cached(
+    mock_subprocess_run: MagicMock, temp_repo_path: Path, monkeypatch
+):
+    monkeypatch.setattr(iac_checker, "_FINDINGS_CACHE", {})
+    monkeypatch.setattr(iac_checker, "_clean_head_sha", lambda repo_root: "abc123")
+    rules_config = IaCValidationRules(
+        rules=[IaCValidationRuleItem(type="terraform_validate", paths=["infra"])],
+        enabled=True,
+    )
+
+    # Fails before `terraform init`, then passes: the failure must not be replayed
+    mock_subprocess_run.side_effect = fake_completed_run(1, stderr="Failure in infra")
+    first = iac_checker.check_iac_validations(str(temp_repo_path), rules_config, use_cache=True)
+    assert first[0].rule_id == "TERRAFORM_VALIDATE_FAILED"
+
+    mock_subprocess_run.side_effect = fake_completed_run(0)
+    second = iac_checker.check_iac_validations(str(temp_repo_path), rules_config, use_cache=True)
+    assert second == []
+    assert mock_subprocess_run.call_count == 2
+
+
+def test_check_iac_validations_cache_is_opt_in(
+    mock_subprocess_run: MagicMock, temp_repo_path: Path, monkeypatch
+):
+    monkeypatch.setattr(iac_checker, "_FINDINGS_CACHE", {})
+    clean_head_sha = MagicMock(return_value="abc123")
+    monkeypatch.setattr(iac_checker, "_clean_head_sha", clean_head_sha)
+    mock_subprocess_run.side_effect = fake_completed_run(0)
+    rules_config = IaCValidationRules(
+        rules=[IaCValidationRuleItem(type="terraform_validate", paths=["infra"])],
+        enabled=True,
+    )
+
+    iac_checker.check_iac_validations(str(temp_repo_path), rules_config)
+    iac_checker.check_iac_validations(str(temp_repo_path), rules_config)
+    assert mock_subprocess_run.call_count == 2
+    clean_head_sha.assert_not_called()  # No git work unless the cache is requested
+    assert not iac_checker._FINDINGS_CACHE
+
+
+def test_check_iac_validations_cache_evicts_expired_entries(
+    mock_subprocess_run: MagicMock, temp_repo_path: Path, monkeypatch
+):
+    expired_at = -2 * iac_checker.FINDINGS_CACHE_TTL_SECONDS
+    monkeypatch.setattr(
+        iac_checker, "_FINDINGS_CACHE", {("/old", "deadbeef", "rules"): expired_at}
+    )
+    monkeypatch.setattr(iac_checker, "_clean_head_sha", lambda repo_root: "abc123")
+    mock_subprocess_run.side_effect = fake_completed_run(0)
+    rules_config = IaCValidationRules(
+        rules=[IaCValidationRuleItem(type="terraform_validate", paths=["infra"])],
+        enabled=True,
+    )
+
+    iac_checker.check_iac_validations(str(temp_repo_path), rules_config, use_cache=True)
+    assert list(iac_checker._FINDINGS_CACHE) == [
+        (str(temp_repo_path.resolve()), "abc123", ANY)
+    ]
@@ -159,6 +159,21 @@ def test_markdown_renderer_outputs_section(
     assert "| `instance_ips` | Public IPs. | `False` |" in md
 
 
+def test_markdown_renderer_multiline_description_in_table():
+    var = TerraformVariableDoc(
+        name="tags", type="map(string)", description="Line one\r\nLine | two"
+    )
+    module_doc = TerraformModuleProcessedDoc(
+        module_path="/m",
+        files=[TerraformFileDoc(file_path="variables.tf", variables=[var])],
+    )
+    md = MarkdownRenderer(module_doc).render_module_documentation()
+    assert (
+        "| `tags` | Line one <br> Line \\| two | `map(string)` | *(Required)* | `False` |"
+        in md
+    )
+
+
 def test_markdown_renderer_resources_section(
     sample_module_doc_data: TerraformModuleProcessedDoc,
 ):
@@ -214,3 +229,4 @@ def test_markdown_renderer_no_files():
     assert "# Terraform Module: `module`" in md  # Basename should still work
     assert "## File:" not in md  # No file sections
     assert "---" not in md
+
@@ -1,4 +1,5 @@
 import pytest
+import os
 from pathlib import Path
 import shutil  # For cleaning up test dirs if needed (though tmp_path is better)
 
@@ -14,6 +15,7 @@ from src.mcp_tools.iac_doc_generator.models import (
 from src.mcp_tools.iac_doc_generator.terraform_hcl_parser import (
     parse_hcl_file_content,
     parse_terraform_module_directory,
+    MIN_FILES_FOR_POOL,
     _extract_description_from_block_body,  # Test helper if needed
     _extract_string_or_first_from_list,  # Test helper if needed
 )
@@ -120,24 +122,28 @@ def test_parse_hcl_main_tf_content(sample_hcl_content_main):
     assert file_doc.module_calls[0].source == "./modules/vpc"
     assert file_doc.module_calls[0].source_file == "main.tf"
 
+    assert file_doc.resources_by_key["aws_instance.my_server"] is file_doc.resources[0]
+    assert file_doc.module_calls_by_name["my_vpc"] is file_doc.module_calls[0]
+
 
 def test_parse_hcl_variables_tf_content(sample_hcl_content_variables):
     file_doc = parse_hcl_file_content(sample_hcl_content_variables, "variables.tf")
 
     assert len(file_doc.variables) == 3
+    variables = file_doc.variables_by_name
 
-    var_instance_name = next(v for v in file_doc.variables if v.name == "instance_name")
+    var_instance_name = variables["instance_name"]
     assert var_instance_name.description == "Name for the EC2 instance"
     assert var_instance_name.type == "string"
     assert var_instance_name.default == "DefaultServerName"
     assert var_instance_name.is_sensitive is False
 
-    var_is_prod = next(v for v in file_doc.variables if v.name == "is_prod")
+    var_is_prod = variables["is_prod"]
     assert var_is_prod.type == "bool"
     assert var_is_prod.default is False
     assert var_is_prod.is_sensitive is True
 
-    var_no_desc = next(v for v in file_doc.variables if v.name == "no_desc_no_type")
+    var_no_desc = variables["no_desc_no_type"]
     assert var_no_desc.description is None
     assert var_no_desc.type is None  # hcl2 will parse type as None if not specified
 
@@ -146,18 +152,27 @@ def test_parse_hcl_outputs_tf_content(sample_hcl_content_outputs):
     file_doc = parse_hcl_file_content(sample_hcl_content_outputs, "outputs.tf")
 
     assert len(file_doc.outputs) == 2
+    outputs = file_doc.outputs_by_name
 
-    out_server_ip = next(o for o in file_doc.outputs if o.name == "server_ip")
+    out_server_ip = outputs["server_ip"]
     assert out_server_ip.description == "Public IP of the server"
     assert out_server_ip.is_sensitive is False
 
-    out_vpc_id = next(o for o in file_doc.outputs if o.name == "vpc_id")
+    out_vpc_id = outputs["vpc_id"]
     assert out_vpc_id.description is None
     assert out_vpc_id.is_sensitive is True
 
 
-def test_parse_hcl_empty_content():
-    file_doc = parse_hcl_file_content("", "empty.tf")
+@pytest.mark.parametrize("content", ["", "  \n\t\n"])
+def test_parse_hcl_empty_content(content, monkeypatch):
+    from src.mcp_tools.iac_doc_generator import terraform_hcl_parser
+
+    def fail_parse(hcl_content):
+        raise AssertionError("empty content should not reach the HCL parser")
+
+    monkeypatch.setattr(terraform_hcl_parser, "_parse_hcl", fail_parse)
+    file_doc = parse_hcl_file_content(content, "empty.tf")
+    assert file_doc.file_path == "empty.tf"
     assert not file_doc.variables
     assert not file_doc.outputs
     assert not file_doc.resources
@@ -176,6 +191,17 @@ def test_parse_hcl_invalid_syntax(capsys):
     assert not file_doc.resources
 
 
+def test_parse_hcl_invalid_syntax_collects_warning(capsys):
+    warnings = []
+    file_doc = parse_hcl_file_content(
+        "resource 'invalid' {}", "invalid.tf", warnings_out=warnings
+    )
+    assert len(warnings) == 1
+    assert "Warning: Could not parse HCL file invalid.tf" in warnings[0]
+    assert capsys.readouterr().err == ""  # Collected instead of printed
+    assert not file_doc.resources
+
+
 # --- Tests for parse_terraform_module_directory ---
 
 
@@ -261,3 +287,145 @@ def test_parse_terraform_module_directory_file_with_parsing_error(
 
     captured = capsys.readouterr()
     assert "Warning: Could not parse HCL file bad.tf" in captured.err
+
+
+def test_parse_terraform_module_directory_process_pool(
+    tmp_path: Path, capsys, monkeypatch
+):
+    from src.mcp_tools.iac_doc_generator import terraform_hcl_parser
+
+    pool_max_workers = []
+    real_pool = terraform_hcl_parser.ProcessPoolExecutor
+
+    def recording_pool(max_workers=None):
+        pool_max_workers.append(max_workers)
+        return real_pool(max_workers=max_workers)
+
+    monkeypatch.setattr(terraform_hcl_parser, "ProcessPoolExecutor", recording_pool)
+    monkeypatch.setattr(terraform_hcl_parser.os, "cpu_count", lambda: 64)
+
+    module_dir = tmp_path / "large_module"
+    module_dir.mkdir()
+    file_count = MIN_FILES_FOR_POOL + 1
+    for i in range(file_count):
+        (module_dir / f"res{i}.tf").write_text(
+            f'resource "null_resource" "r{i}" {{}}\n'
+        )
+    (module_dir / "bad.tf").write_text('resource "invalid_syntax {}')
+
+    module_doc = parse_terraform_module_directory(str(module_dir))
+    assert len(module_doc.files) == file_count + 1
+    # One worker per file to parse, never one per CPU
+    assert pool_max_workers == [file_count + 1]
+
+    resource_names = {
+        r.resource_name for f in module_doc.files for r in f.resources
+    }
+    assert resource_names == {f"r{i}" for i in range(file_count)}
+
+    # Warnings from worker processes are reported on the parent's stderr
+    captured = capsys.readouterr()
+    assert "Warning: Could not parse HCL file bad.tf" in captured.err
+
+
+def test_parse_terraform_module_directory_parses_duplicate_content_once(
+    tmp_path: Path, monkeypatch
+):
+    from src.mcp_tools.iac_doc_generator import terraform_hcl_parser
+
+    calls = []
+    real_parse_hcl = terraform_hcl_parser._parse_hcl
+
+    def counting_parse_hcl(hcl_content):
+        calls.append(hcl_content)
+        return real_parse_hcl(hcl_content)
+
+    monkeypatch.setattr(terraform_hcl_parser, "_parse_hcl", counting_parse_hcl)
+
+    module_dir = tmp_path / "duplicated_module"
+    module_dir.mkdir()
+    content = 'variable "tags" {\n  default = { env = "dev" }\n}\n'
+    (module_dir / "a.tf").write_text(content)
+    (module_dir / "b.tf").write_text(content)
+
+    module_doc = parse_terraform_module_directory(str(module_dir))
+    assert len(calls) == 1
+
+    docs = {f.file_path: f for f in module_doc.files}
+    assert set(docs) == {"a.tf", "b.tf"}
+    # Docs share one parse result but not its mutable defaults
+    docs["a.tf"].variables[0].default["env"] = "mutated"
+    assert docs["b.tf"].variables[0].default == {"env": "dev"}
+
+    # Nothing is kept between calls
+    parse_terraform_module_directory(str(module_dir))
+    assert len(calls) == 2
+
+
+def test_parse_terraform_module_directory_concurrent_read(tmp_path: Path, monkeypatch):
+    from src.mcp_tools.iac_doc_generator import terraform_hcl_parser
+
+    read_pools = []
+    real_thread_pool = terraform_hcl_parser.ThreadPoolExecutor
+
+    def recording_thread_pool(max_workers=None):
+        read_pools.append(max_workers)
+        return real_thread_pool(max_workers=max_workers)
+
+    monkeypatch.setattr(terraform_hcl_parser, "ThreadPoolExecutor", recording_thread_pool)
+    monkeypatch.setattr(terraform_hcl_parser, "MIN_FILES_FOR_POOL", 10**6)  # Parse in-process
+
+    module_dir = tmp_path / "many_files"
+    module_dir.mkdir()
+    file_count = terraform_hcl_parser.MIN_FILES_FOR_CONCURRENT_READ + 2
+    for i in range(file_count):
+        (module_dir / f"f{i:02d}.tf").write_text(f'resource "null_resource" "r{i}" {{}}\n')
+
+    module_doc = parse_terraform_module_directory(str(module_dir))
+
+    assert read_pools == [file_count]
+    # Docs keep directory-listing order, and each carries its own file's content
+    listed = [e.name for e in os.scandir(module_dir) if e.name.endswith(".tf")]
+    assert [f.file_path for f in module_doc.files] == listed
+    for file_doc in module_doc.files:
+        index = int(file_doc.file_path[1:3])
+        assert [r.resource_name for r in file_doc.resources] == [f"r{index}"]
+
+
+@pytest.mark.parametrize(
+    "file_count",
+    [
+        pytest.param(3, id="sequential-read"),
+        pytest.param(9, id="concurrent-read"),
+    ],
+)
+def test_parse_terraform_module_directory_unreadable_file(
+    tmp_path: Path, capsys, monkeypatch, file_count
+):
+    from src.mcp_tools.iac_doc_generator import terraform_hcl_parser
+
+    monkeypatch.setattr(terraform_hcl_parser, "MIN_FILES_FOR_POOL", 10**6)  # Parse in-process
+    module_dir = tmp_path / "module_with_unreadable"
+    module_dir.mkdir()
+    for i in range(file_count - 1):
+        (module_dir / f"ok{i}.tf").write_text(f'resource "null_resource" "r{i}" {{}}\n')
+    unreadable = module_dir / "locked.tf"
+    unreadable.write_text('resource "null_resource" "locked" {}\n')
+
+    real_open = open
+
+    def failing_open(file, *args, **kwargs):
+        if Path(file) == unreadable:
+            raise OSError("Permission denied")
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(terraform_hcl_parser, "open", failing_open, raising=False)
+
+    module_doc = parse_terraform_module_directory(str(module_dir))
+
+    # The unreadable file is skipped; the others are still documented
+    assert sorted(f.file_path for f in module_doc.files) == sorted(
+        f"ok{i}.tf" for i in range(file_count - 1)
+    )
+    captured = capsys.readouterr()
+    assert f"Error processing file {unreadable}: Permission denied" in captured.err
@@ -0,0 +1,24 @@
+import pytest
+
+from src.mcp_tools.iac_drift_detector.models import ParsedResource
+
+# Fixtures shared by the drift detector test modules. pytest loads this
+# conftest once per session, so the helpers here are set up a single time.
+
+
+@pytest.fixture(scope="session")
+def make_resource():
+    """Builds a ParsedResource from sensible defaults plus per-test overrides."""
+
+    def _mk(**overrides) -> ParsedResource:
+        fields = dict(
+            id="i-x",
+            type="aws_instance",
+            name="n",
+            provider_name="aws",
+            attributes={},
+        )
+        fields.update(overrides)
+        return ParsedResource(**fields)
+
+    return _mk
@@ -1,5 +1,5 @@
 import pytest
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from src.mcp_tools.iac_drift_detector.models import (
     ParsedResource,
@@ -7,7 +7,9 @@ from src.mcp_tools.iac_drift_detector.models import (
     DriftType,
     AttributeDrift,
 )
+from src.mcp_tools.iac_drift_detector.core_logic import drift_engine
 from src.mcp_tools.iac_drift_detector.core_logic.drift_engine import (
+    build_resource_index,
     compare_states,
     compare_attributes,
     DEFAULT_IGNORED_ATTRIBUTES,
@@ -116,8 +118,9 @@ def test_compare_attributes(
 ):
     drifts = compare_attributes(iac_attrs, actual_attrs, resource_type, ignored_config)
     assert len(drifts) == expected_drifts_count
-    for i, (attr_name, iac_val, act_val) in enumerate(expected_drift_details):
-        found_drift = next((d for d in drifts if d.attribute_name == attr_name), None)
+    drifts_by_name = {d.attribute_name: d for d in drifts}
+    for attr_name, iac_val, act_val in expected_drift_details:
+        found_drift = drifts_by_name.get(attr_name)
         assert (
             found_drift is not None
         ), f"Expected drift for attribute '{attr_name}' not found."
@@ -125,266 +128,248 @@ def test_compare_attributes(
         assert found_drift.actual_value == act_val
 
 
-# --- Test compare_states ---
+def test_compare_attributes_reuses_resolved_ignore_set():
+    ignored_config = {"widget": ["color"]}
+    compare_attributes({"color": "blue"}, {"color": "red"}, "widget", ignored_config)
+    hits_before = drift_engine._frozen_ignored.cache_info().hits
 
+    drifts = compare_attributes(
+        {"color": "blue"}, {"color": "green"}, "widget", {"widget": ["color"]}
+    )
+    assert not drifts
+    assert drift_engine._frozen_ignored.cache_info().hits == hits_before + 1
 
-def test_compare_states_modified_missing_unmanaged():
-    iac_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-instance-01",
-            type="vm",
-            name="web_server_iac",
-            provider_name="mock",
-            attributes={
-                "size": "medium",
-                "image": "ubuntu-20.04",
-                "tags": {"env": "prod"},
-            },
-        ),
-        ParsedResource(
-            id="id-db-01",
-            type="database",
-            name="main_db_iac",
-            provider_name="mock",
-            attributes={"version": "12", "storage": "100GB"},
-        ),  # Missing
-    ]
-    actual_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-instance-01",
-            type="vm",
-            name="web_server_actual",
-            provider_name="mock",
-            attributes={
-                "size": "large",
-                "image": "ubuntu-20.04",
-                "tags": {"env": "prod", "extra_tag": "hello"},
-            },
-        ),  # Modified size
-        ParsedResource(
-            id="id-disk-unmanaged",
-            type="disk",
-            name="orphan_disk_actual",
-            provider_name="mock",
-            attributes={"size": "50GB"},
-        ),  # Unmanaged
-    ]
 
-    drifts = compare_states(iac_state, actual_state)
-    assert len(drifts) == 3
+# --- Test compare_states ---
 
-    modified_drift = next(
-        (
-            d
-            for d in drifts
-            if d.drift_type == DriftType.MODIFIED and d.resource_id == "id-instance-01"
-        ),
-        None,
-    )
-    assert modified_drift is not None
-    assert any(ad.attribute_name == "size" for ad in modified_drift.attribute_drifts)
 
-    missing_drift = next(
-        (
-            d
-            for d in drifts
-            if d.drift_type == DriftType.MISSING_IN_ACTUAL
-            and d.resource_id == "id-db-01"
-        ),
-        None,
+def _resource(
+    id: str, type: str, name: str, attributes: Optional[Dict[str, Any]] = None
+) -> ParsedResource:
+    return ParsedResource(
+        id=id,
+        type=type,
+        name=name,
+        provider_name="mock",
+        attributes=attributes or {},
     )
-    assert missing_drift is not None
 
-    unmanaged_drift = next(
-        (
-            d
-            for d in drifts
-            if d.drift_type == DriftType.UNMANAGED_IN_ACTUAL
-            and d.resource_id == "id-disk-unmanaged"
-        ),
-        None,
-    )
-    assert unmanaged_drift is not None
 
-
-def test_compare_states_no_drift():
-    iac_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-vm-100",
-            type="vm",
-            name="app_server",
-            provider_name="mock",
-            attributes={"image": "centos8", "cpu": 2},
-        ),
-    ]
-    actual_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-vm-100",
-            type="vm",
-            name="app_server_live",
-            provider_name="mock",
-            attributes={"image": "centos8", "cpu": 2},
-        ),
-    ]
-    drifts = compare_states(iac_state, actual_state)
-    assert not drifts, f"Expected no drift, but got: {drifts}"
+# Each case: (iac_state, actual_state, ignored_attributes_config, expected_drifts).
+# expected_drifts lists (drift_type, resource_id, attribute_drifts, message_fragment)
+# where attribute_drifts are (name, iac_value, actual_value) tuples and
+# message_fragment (or None) must appear in the drift message.
+COMPARE_STATES_CASES = [
+    pytest.param(
+        [
+            _resource(
+                "id-instance-01",
+                "vm",
+                "web_server_iac",
+                {"size": "medium", "image": "ubuntu-20.04", "tags": {"env": "prod"}},
+            ),
+            _resource(
+                "id-db-01",
+                "database",
+                "main_db_iac",
+                {"version": "12", "storage": "100GB"},
+            ),  # Missing
+        ],
+        [
+            _resource(
+                "id-instance-01",
+                "vm",
+                "web_server_actual",
+                {
+                    "size": "large",
+                    "image": "ubuntu-20.04",
+                    "tags": {"env": "prod", "extra_tag": "hello"},
+                },
+            ),  # Modified size
+            _resource(
+                "id-disk-unmanaged", "disk", "orphan_disk_actual", {"size": "50GB"}
+            ),  # Unmanaged
+        ],
+        None,
+        [
+            (
+                DriftType.MODIFIED,
+                "id-instance-01",
+                [("size", "medium", "large")],
+                None,
+            ),
+            (DriftType.MISSING_IN_ACTUAL, "id-db-01", [], None),
+            (DriftType.UNMANAGED_IN_ACTUAL, "id-disk-unmanaged", [], None),
+        ],
+        id="modified_missing_unmanaged",
+    ),
+    pytest.param(
+        [_resource("id-vm-100", "vm", "app_server", {"image": "centos8", "cpu": 2})],
+        [
+            _resource(
+                "id-vm-100", "vm", "app_server_live", {"image": "centos8", "cpu": 2}
+            )
+        ],
+        None,
+        [],
+        id="no_drift",
+    ),
+    pytest.param(
+        [
+            _resource(
+                "id-vm-200",
+                "vm",
+                "worker",
+                {
+                    "image": "debian",
+                    "ram": "4GB",
+                    "last_updated_time": "ts1",
+                    "tags": {"managed_by": "iac"},
+                },
+            )
+        ],
+        [
+            _resource(
+                "id-vm-200",
+                "vm",
+                "worker_live",
+                {
+                    "image": "debian",
+                    "ram": "4GB",
+                    "last_updated_time": "ts2",
+                    "dynamic_ip": "1.2.3.4",
+                    "tags": {"managed_by": "iac", "status": "running"},
+                },
+            )
+        ],
+        {"vm": ["last_updated_time", "dynamic_ip"]},
+        [],
+        id="ignored_attributes",
+    ),
+    pytest.param(
+        [
+            _resource(
+                "id-vm-300",
+                "vm",
+                "tagged_vm",
+                {"tags": {"env": "staging", "owner": "team-a"}},
+            )
+        ],
+        [
+            _resource(
+                "id-vm-300",
+                "vm",
+                "tagged_vm_live",
+                {"tags": {"env": "prod", "owner": "team-a", "new_tag": "val"}},
+            )
+        ],
+        None,
+        [(DriftType.MODIFIED, "id-vm-300", [("tags.env", "staging", "prod")], None)],
+        id="tag_value_modified",
+    ),
+    pytest.param(
+        # Same ID with different resource types (rare, but possible if IDs are not
+        # universally unique): one MODIFIED drift reporting the mismatch.
+        [_resource("id-shared-01", "vm", "resource_a")],
+        [_resource("id-shared-01", "disk", "resource_b_actual")],
+        None,
+        [(DriftType.MODIFIED, "id-shared-01", [], "Type mismatch")],
+        id="type_mismatch_on_same_id",
+    ),
+    pytest.param(
+        [],
+        [
+            _resource("id-unmanaged-1", "vm", "vm1"),
+            _resource("id-unmanaged-2", "disk", "disk1"),
+        ],
+        None,
+        [
+            (DriftType.UNMANAGED_IN_ACTUAL, "id-unmanaged-1", [], None),
+            (DriftType.UNMANAGED_IN_ACTUAL, "id-unmanaged-2", [], None),
+        ],
+        id="empty_iac_all_unmanaged",
+    ),
+    pytest.param(
+        [
+            _resource("id-missing-1", "vm", "vm_iac_1"),
+            _resource("id-missing-2", "disk", "disk_iac_1"),
+        ],
+        [],
+        None,
+        [
+            (DriftType.MISSING_IN_ACTUAL, "id-missing-1", [], None),
+            (DriftType.MISSING_IN_ACTUAL, "id-missing-2", [], None),
+        ],
+        id="empty_actual_all_missing",
+    ),
+    pytest.param(
+        # IaC resources without an id (e.g. malformed state) are skipped by the
+        # id-based matching, so the actual resource is reported as UNMANAGED.
+        # An empty id is used since ParsedResource requires a string.
+        [_resource("", "vm", "vm_no_id")],
+        [_resource("id-actual-1", "vm", "vm_actual_1")],
+        None,
+        [(DriftType.UNMANAGED_IN_ACTUAL, "id-actual-1", [], None)],
+        id="no_ids_in_iac_resources",
+    ),
+]
 
 
-def test_compare_states_ignored_attributes():
-    custom_ignored = {"vm": ["last_updated_time", "dynamic_ip"]}
-    iac_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-vm-200",
-            type="vm",
-            name="worker",
-            provider_name="mock",
-            attributes={
-                "image": "debian",
-                "ram": "4GB",
-                "last_updated_time": "ts1",
-                "tags": {"managed_by": "iac"},
-            },
-        ),
-    ]
-    actual_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-vm-200",
-            type="vm",
-            name="worker_live",
-            provider_name="mock",
-            attributes={
-                "image": "debian",
-                "ram": "4GB",
-                "last_updated_time": "ts2",
-                "dynamic_ip": "1.2.3.4",
-                "tags": {"managed_by": "iac", "status": "running"},
-            },
-        ),
-    ]
+@pytest.mark.parametrize(
+    "iac_state, actual_state, ignored_config, expected_drifts", COMPARE_STATES_CASES
+)
+def test_compare_states(
+    iac_state: List[ParsedResource],
+    actual_state: List[ParsedResource],
+    ignored_config,
+    expected_drifts,
+):
     drifts = compare_states(
-        iac_state, actual_state, ignored_attributes_config=custom_ignored
+        iac_state, actual_state, ignored_attributes_config=ignored_config
     )
-    assert not drifts, f"Expected no drift due to ignored attributes, but got: {drifts}"
+    assert len(drifts) == len(expected_drifts), f"Unexpected drifts: {drifts}"
 
+    drifts_by_key = {(d.drift_type, d.resource_id): d for d in drifts}
+    for drift_type, resource_id, attribute_drifts, message_fragment in expected_drifts:
+        drift = drifts_by_key.get((drift_type, resource_id))
+        assert drift is not None, f"Expected {drift_type} drift for '{resource_id}'."
+        assert [
+            (ad.attribute_name, ad.iac_value, ad.actual_value)
+            for ad in drift.attribute_drifts
+        ] == attribute_drifts
+        if message_fragment is not None:
+            assert message_fragment in drift.message
 
-def test_compare_states_tag_value_modified():
-    iac_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-vm-300",
-            type="vm",
-            name="tagged_vm",
-            provider_name="mock",
-            attributes={"tags": {"env": "staging", "owner": "team-a"}},
-        ),
-    ]
-    actual_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-vm-300",
-            type="vm",
-            name="tagged_vm_live",
-            provider_name="mock",
-            attributes={"tags": {"env": "prod", "owner": "team-a", "new_tag": "val"}},
-        ),
-    ]
-    drifts = compare_states(iac_state, actual_state)
-    assert len(drifts) == 1
-    assert drifts[0].drift_type == DriftType.MODIFIED
-    assert len(drifts[0].attribute_drifts) == 1
-    assert drifts[0].attribute_drifts[0].attribute_name == "tags.env"
-    assert drifts[0].attribute_drifts[0].iac_value == "staging"
-    assert drifts[0].attribute_drifts[0].actual_value == "prod"
 
+def test_build_resource_index_skips_missing_ids():
+    with_id = _resource("id-1", "vm", "vm1")
+    index = build_resource_index([with_id, _resource("", "vm", "no_id")])
+    assert index == {"id-1": with_id}
 
-def test_compare_states_type_mismatch_on_same_id():
-    """Test scenario where same ID has different resource types (should be rare, but possible if IDs are not universally unique)."""
-    iac_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-shared-01",
-            type="vm",
-            name="resource_a",
-            provider_name="mock",
-            attributes={},
-        )
+
+def test_compare_states_large_scale():
+    # 10k resources per side: ids 0..9999 in IaC, 5000..14999 in actual
+    count = 10_000
+    iac_state = [
+        _resource(f"id-{i}", "vm", f"vm_{i}", {"size": "small"}) for i in range(count)
     ]
-    actual_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-shared-01",
-            type="disk",
-            name="resource_b_actual",
-            provider_name="mock",
-            attributes={},
+    actual_state = [
+        _resource(
+            f"id-{i}", "vm", f"vm_{i}", {"size": "large" if i % 2 else "small"}
         )
+        for i in range(count // 2, count + count // 2)
     ]
-    drifts = compare_states(iac_state, actual_state)
-    assert len(drifts) == 1  # Should be one MODIFIED drift indicating type mismatch
-    assert drifts[0].drift_type == DriftType.MODIFIED
-    assert "Type mismatch" in drifts[0].message
 
-
-def test_compare_states_empty_iac_all_unmanaged():
-    iac_state: List[ParsedResource] = []
-    actual_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-unmanaged-1",
-            type="vm",
-            name="vm1",
-            provider_name="mock",
-            attributes={},
-        ),
-        ParsedResource(
-            id="id-unmanaged-2",
-            type="disk",
-            name="disk1",
-            provider_name="mock",
-            attributes={},
-        ),
-    ]
     drifts = compare_states(iac_state, actual_state)
-    assert len(drifts) == 2
-    assert all(d.drift_type == DriftType.UNMANAGED_IN_ACTUAL for d in drifts)
 
-
-def test_compare_states_empty_actual_all_missing():
-    iac_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-missing-1",
-            type="vm",
-            name="vm_iac_1",
-            provider_name="mock",
-            attributes={},
-        ),
-        ParsedResource(
-            id="id-missing-2",
-            type="disk",
-            name="disk_iac_1",
-            provider_name="mock",
-            attributes={},
-        ),
-    ]
-    actual_state: List[ParsedResource] = []
-    drifts = compare_states(iac_state, actual_state)
-    assert len(drifts) == 2
-    assert all(d.drift_type == DriftType.MISSING_IN_ACTUAL for d in drifts)
-
-
-def test_compare_states_no_ids_in_iac_resources():
-    """Test how it handles IaC resources that might be missing 'id' (e.g. malformed state)."""
-    iac_state: List[ParsedResource] = [
-        ParsedResource(id=None, type="vm", name="vm_no_id", provider_name="mock", attributes={})  # type: ignore
-    ]
-    actual_state: List[ParsedResource] = [
-        ParsedResource(
-            id="id-actual-1",
-            type="vm",
-            name="vm_actual_1",
-            provider_name="mock",
-            attributes={},
-        )
-    ]
-    # Current implementation of compare_states uses `iac_by_id = {res.id: res for res in iac_resources if res.id}`
-    # So, iac_resource without id will be skipped for MODIFIED/MISSING checks based on ID.
-    # The actual resource will then be found as UNMANAGED.
-    drifts = compare_states(iac_state, actual_state)
-    assert len(drifts) == 1
-    assert drifts[0].drift_type == DriftType.UNMANAGED_IN_ACTUAL
-    assert drifts[0].resource_id == "id-actual-1"
+    counts: Dict[DriftType, int] = {}
+    for d in drifts:
+        counts[d.drift_type] = counts.get(d.drift_type, 0) + 1
+    assert counts == {
+        DriftType.MISSING_IN_ACTUAL: count // 2,
+        DriftType.MODIFIED: count // 4,  # Odd ids in the overlapping half
+        DriftType.UNMANAGED_IN_ACTUAL: count // 2,
+    }
+    # Report order is stable: IaC order for modified/missing, then actual order
+    assert drifts[0].resource_id == "id-0"
+    assert drifts[-1].resource_id == f"id-{count + count // 2 - 1}"
@@ -3,24 +3,21 @@ from src.mcp_tools.iac_drift_detector.models import (
     DriftInfo,
     DriftType,
     AttributeDrift,
-    ParsedResource,
 )
 from src.mcp_tools.iac_drift_detector.core_logic.remediation import suggest_remediation
 
 # --- Test suggest_remediation ---
 
 
-def test_suggest_remediation_missing_in_actual_terraform():
+def test_suggest_remediation_missing_in_actual_terraform(make_resource):
     drift = DriftInfo(
         drift_type=DriftType.MISSING_IN_ACTUAL,
         resource_type="aws_instance",
         resource_name="web_server_01",
-        iac_resource=ParsedResource(
+        iac_resource=make_resource(
             id="i-expected123",
             type="aws_instance",
             name="web_server_01",
-            provider_name="aws",
-            attributes={},
         ),
     )
     suggestions = suggest_remediation(drift, iac_tool="terraform")
@@ -32,18 +29,16 @@ def test_suggest_remediation_missing_in_actual_terraform():
     assert "Run 'terraform apply' to create the resource." in suggestions[1]
 
 
-def test_suggest_remediation_missing_in_actual_with_module_terraform():
+def test_suggest_remediation_missing_in_actual_with_module_terraform(make_resource):
     drift = DriftInfo(
         drift_type=DriftType.MISSING_IN_ACTUAL,
         resource_type="aws_instance",
         resource_name="web_server_module",
-        iac_resource=ParsedResource(
+        iac_resource=make_resource(
             id="i-expected456",
             type="aws_instance",
             name="web_server_module",
-            provider_name="aws",
             module="module.my_module",
-            attributes={},
         ),
     )
     suggestions = suggest_remediation(drift, iac_tool="terraform")
@@ -51,18 +46,16 @@ def test_suggest_remediation_missing_in_actual_with_module_terraform():
     assert "(Resource is in module: module.my_module)" in suggestions[2]
 
 
-def test_suggest_remediation_unmanaged_in_actual_terraform():
+def test_suggest_remediation_unmanaged_in_actual_terraform(make_resource):
     drift = DriftInfo(
         drift_type=DriftType.UNMANAGED_IN_ACTUAL,
         resource_type="aws_s3_bucket",
         resource_name="manual-bucket-007",
         resource_id="manual-bucket-007-id",
-        actual_resource=ParsedResource(
+        actual_resource=make_resource(
             id="manual-bucket-007-id",
             type="aws_s3_bucket",
             name="manual-bucket-007",
-            provider_name="aws",
-            attributes={},
         ),
     )
     suggestions = suggest_remediation(drift, iac_tool="terraform")
@@ -78,7 +71,7 @@ def test_suggest_remediation_unmanaged_in_actual_terraform():
     assert "Suggestion 2: If the resource is not needed" in suggestions[3]
 
 
-def test_suggest_remediation_modified_terraform():
+def test_suggest_remediation_modified_terraform(make_resource):
     attr_drifts = [
         AttributeDrift(
             attribute_name="instance_type",
@@ -92,18 +85,16 @@ def test_suggest_remediation_modified_terraform():
         resource_type="aws_instance",
         resource_name="app_server_main",
         resource_id="i-actual456",
-        iac_resource=ParsedResource(
+        iac_resource=make_resource(
             id="i-actual456",
             type="aws_instance",
             name="app_server_main",
-            provider_name="aws",
             attributes={"instance_type": "t2.micro"},
         ),
-        actual_resource=ParsedResource(
+        actual_resource=make_resource(
             id="i-actual456",
             type="aws_instance",
             name="app_server_main_live",
-            provider_name="aws",
             attributes={"instance_type": "t3.small", "monitoring": True},
         ),
         attribute_drifts=attr_drifts,
@@ -148,17 +139,16 @@ def test_suggest_remediation_unknown_drift_type():
     )
 
 
-def test_suggest_remediation_generic_iac_tool():
+def test_suggest_remediation_generic_iac_tool(make_resource):
     drift_missing = DriftInfo(
         drift_type=DriftType.MISSING_IN_ACTUAL,
         resource_type="generic_resource",
         resource_name="test_res",
-        iac_resource=ParsedResource(
+        iac_resource=make_resource(
             id="gen-id-123",
             type="generic_resource",
             name="test_res",
             provider_name="any",
-            attributes={},
         ),
     )
     suggestions = suggest_remediation(
@@ -175,12 +165,11 @@ def test_suggest_remediation_generic_iac_tool():
         resource_type="another_resource",
         resource_name="unmanaged_res",
         resource_id="unmanaged-id-456",
-        actual_resource=ParsedResource(
+        actual_resource=make_resource(
             id="unmanaged-id-456",
             type="another_resource",
             name="unmanaged_res",
             provider_name="any",
-            attributes={},
         ),
     )
     suggestions_unmanaged = suggest_remediation(
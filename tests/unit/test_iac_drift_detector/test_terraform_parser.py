@@ -1,18 +1,36 @@
 import pytest
 import json
+import logging
 from pathlib import Path
 from typing import List
 
 from src.mcp_tools.iac_drift_detector.models import ParsedResource
 from src.mcp_tools.iac_drift_detector.parsers.terraform_parser import (
     parse_terraform_state_file,
+    parse_terraform_state_dict,
     parse_terraform_plan_json_file,
+    parse_terraform_plan_dict,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(file_path: Path, content: dict) -> None:
+    """Writes `content` as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        file_path.write_bytes(orjson.dumps(content))
+    else:
+        file_path.write_text(json.dumps(content))
+
 # --- Fixtures for Sample Data ---
+# The sample contents are never mutated, so they (and the files written from
+# them) are built once per test session.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tfstate_content() -> dict:
     return {
         "version": 4,
@@ -68,15 +86,41 @@ def sample_tfstate_content() -> dict:
     }
 
 
-@pytest.fixture
-def temp_tfstate_file(tmp_path: Path, sample_tfstate_content: dict) -> Path:
-    file_path = tmp_path / "test.tfstate"
-    with open(file_path, "w") as f:
-        json.dump(sample_tfstate_content, f)
-    return file_path
+@pytest.fixture(scope="session")
+def tfstate_variants(sample_tfstate_content: dict) -> dict:
+    return {
+        "valid": sample_tfstate_content,
+        "empty": {"version": 4, "resources": []},
+        "no_key": {"version": 4},  # Missing 'resources' key
+        "malformed": {
+            "version": 4,
+            "resources": [
+                {
+                    "mode": "managed",
+                    "type": "aws_instance",
+                    "name": "bad_instance",
+                    "provider": 'provider["registry.terraform.io/hashicorp/aws"]',
+                    "instances": [
+                        {"attributes": {"ami": "ami-123"}}  # Missing "id" in attributes
+                    ],
+                }
+            ],
+        },
+    }
+
 
+@pytest.fixture(scope="session")
+def tfstate_files(tmp_path_factory, tfstate_variants: dict) -> dict:
+    tf_dir = tmp_path_factory.mktemp("tf")
+    files = {}
+    for variant, content in tfstate_variants.items():
+        file_path = tf_dir / f"{variant}.tfstate"
+        write_json(file_path, content)
+        files[variant] = file_path
+    return files
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_tfplan_json_content() -> dict:
     return {
         "format_version": "1.0",
@@ -110,19 +154,18 @@ def sample_tfplan_json_content() -> dict:
     }
 
 
-@pytest.fixture
-def temp_tfplan_json_file(tmp_path: Path, sample_tfplan_json_content: dict) -> Path:
-    file_path = tmp_path / "test_plan.json"
-    with open(file_path, "w") as f:
-        json.dump(sample_tfplan_json_content, f)
+@pytest.fixture(scope="session")
+def temp_tfplan_json_file(tmp_path_factory, sample_tfplan_json_content: dict) -> Path:
+    file_path = tmp_path_factory.mktemp("tf") / "test_plan.json"
+    write_json(file_path, sample_tfplan_json_content)
     return file_path
 
 
-# --- Tests for parse_terraform_state_file ---
+# --- Tests for parse_terraform_state_file / parse_terraform_state_dict ---
 
 
-def test_parse_tfstate_valid_file(temp_tfstate_file: Path):
-    resources = parse_terraform_state_file(str(temp_tfstate_file))
+def test_parse_tfstate_valid_content(sample_tfstate_content: dict):
+    resources = parse_terraform_state_dict(sample_tfstate_content)
     assert (
         len(resources) == 3
     )  # 2 managed resources + 1 null_resource, data source ignored
@@ -148,52 +191,46 @@ def test_parse_tfstate_valid_file(temp_tfstate_file: Path):
     assert null_res.provider_name == "null"  # Check provider name extraction
 
 
-def test_parse_tfstate_empty_resources():
-    empty_tfstate = {"version": 4, "resources": []}
-    # Use Path object from tmp_path for writing
-    file_path = Path(
-        Path(__file__).parent / "empty.tfstate"
-    )  # Not ideal, should use tmp_path
-    with open(file_path, "w") as f:
-        json.dump(empty_tfstate, f)
-
-    resources = parse_terraform_state_file(str(file_path))
-    assert len(resources) == 0
-    file_path.unlink()  # Clean up
-
-
-def test_parse_tfstate_no_resources_key(tmp_path: Path):
-    no_res_key_tfstate = {"version": 4}  # Missing 'resources' key
-    file_path = tmp_path / "no_res.tfstate"
-    with open(file_path, "w") as f:
-        json.dump(no_res_key_tfstate, f)
-
-    resources = parse_terraform_state_file(str(file_path))
-    assert len(resources) == 0
-
-
-def test_parse_tfstate_file_not_found(capsys):
-    resources = parse_terraform_state_file("non_existent_file.tfstate")
+@pytest.mark.parametrize(
+    "variant, expected_count",
+    [
+        pytest.param("valid", 3, id="valid"),
+        pytest.param("empty", 0, id="empty-resources"),
+        pytest.param("no_key", 0, id="no-resources-key"),
+        pytest.param("malformed", 0, id="missing-id"),
+    ],
+)
+def test_parse_tfstate_file(
+    tfstate_files: dict, tfstate_variants: dict, variant: str, expected_count: int
+):
+    # The file wrapper loads the JSON and defers to parse_terraform_state_dict
+    resources = parse_terraform_state_file(str(tfstate_files[variant]))
+    assert len(resources) == expected_count
+    assert resources == parse_terraform_state_dict(tfstate_variants[variant])
+
+
+def test_parse_tfstate_file_not_found(caplog):
+    with caplog.at_level(logging.ERROR):
+        resources = parse_terraform_state_file("non_existent_file.tfstate")
     assert len(resources) == 0
-    captured = capsys.readouterr()
-    assert "Error: Terraform state file not found" in captured.err
+    assert "Error: Terraform state file not found" in caplog.text
 
 
-def test_parse_tfstate_invalid_json(tmp_path: Path, capsys):
+def test_parse_tfstate_invalid_json(tmp_path: Path, caplog):
     file_path = tmp_path / "invalid.tfstate"
     file_path.write_text("this is not json")
 
-    resources = parse_terraform_state_file(str(file_path))
+    with caplog.at_level(logging.ERROR):
+        resources = parse_terraform_state_file(str(file_path))
     assert len(resources) == 0
-    captured = capsys.readouterr()
-    assert "Error: Invalid JSON" in captured.err
+    assert "Error: Invalid JSON" in caplog.text
 
 
-# --- Tests for parse_terraform_plan_json_file ---
+# --- Tests for parse_terraform_plan_json_file / parse_terraform_plan_dict ---
 
 
-def test_parse_tfplan_valid_file(temp_tfplan_json_file: Path):
-    changes = parse_terraform_plan_json_file(str(temp_tfplan_json_file))
+def test_parse_tfplan_valid_content(sample_tfplan_json_content: dict):
+    changes = parse_terraform_plan_dict(sample_tfplan_json_content)
     assert len(changes) == 3  # Includes no-op for now
 
     create_change = next(
@@ -211,53 +248,31 @@ def test_parse_tfplan_valid_file(temp_tfplan_json_file: Path):
     assert update_change["change"]["after"]["acl"] == "public-read"
 
 
-def test_parse_tfplan_file_not_found(capsys):
-    changes = parse_terraform_plan_json_file("non_existent_plan.json")
+def test_parse_tfplan_valid_file(
+    temp_tfplan_json_file: Path, sample_tfplan_json_content: dict
+):
+    changes = parse_terraform_plan_json_file(str(temp_tfplan_json_file))
+    assert changes == parse_terraform_plan_dict(sample_tfplan_json_content)
+
+
+def test_parse_tfplan_file_not_found(caplog):
+    with caplog.at_level(logging.ERROR):
+        changes = parse_terraform_plan_json_file("non_existent_plan.json")
     assert len(changes) == 0
-    captured = capsys.readouterr()
-    assert "Error: Terraform plan JSON file not found" in captured.err
+    assert "Error: Terraform plan JSON file not found" in caplog.text
 
 
-def test_parse_tfplan_invalid_json(tmp_path: Path, capsys):
+def test_parse_tfplan_invalid_json(tmp_path: Path, caplog):
     file_path = tmp_path / "invalid_plan.json"
     file_path.write_text("{not_json_at_all")
 
-    changes = parse_terraform_plan_json_file(str(file_path))
+    with caplog.at_level(logging.ERROR):
+        changes = parse_terraform_plan_json_file(str(file_path))
     assert len(changes) == 0
-    captured = capsys.readouterr()
-    assert "Error: Invalid JSON" in captured.err
+    assert "Error: Invalid JSON" in caplog.text
 
 
-def test_parse_tfplan_empty_changes(tmp_path: Path):
+def test_parse_tfplan_empty_changes():
     plan_content = {"format_version": "1.0", "resource_changes": []}
-    file_path = tmp_path / "empty_changes_plan.json"
-    with open(file_path, "w") as f:
-        json.dump(plan_content, f)
-    changes = parse_terraform_plan_json_file(str(file_path))
+    changes = parse_terraform_plan_dict(plan_content)
     assert len(changes) == 0
-
-
-def test_parse_tfstate_resource_missing_id_type_name(tmp_path: Path, capsys):
-    # Test case where a resource instance might be malformed (e.g., missing 'id')
-    malformed_tfstate_content = {
-        "version": 4,
-        "resources": [
-            {
-                "mode": "managed",
-                "type": "aws_instance",
-                "name": "bad_instance",
-                "provider": 'provider["registry.terraform.io/hashicorp/aws"]',
-                "instances": [
-                    {"attributes": {"ami": "ami-123"}}  # Missing "id" in attributes
-                ],
-            }
-        ],
-    }
-    file_path = tmp_path / "malformed.tfstate"
-    with open(file_path, "w") as f:
-        json.dump(malformed_tfstate_content, f)
-
-    resources = parse_terraform_state_file(str(file_path))
-    assert len(resources) == 0
-    # captured = capsys.readouterr() # Optional: check for warning message if you add one
-    # assert "Warning: Skipping resource instance due to missing id" in captured.err (if you uncomment print in parser)
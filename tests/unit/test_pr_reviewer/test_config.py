@@ -1,6 +1,5 @@
 import pytest
 import yaml
-import os
 import re
 from pydantic import ValidationError
 
@@ -19,6 +18,25 @@ from src.mcp_tools.pr_reviewer.config import (
     DEFAULT_CONFIG_FILENAME,
 )
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+# pytest.raises accepts compiled patterns for `match`.
+_RE_YAML_ERR = re.compile("Error parsing YAML configuration file")
+_RE_VALIDATION_ERR = re.compile("Configuration validation error")
+
+_DEFAULT_BRANCH_PATTERN = "^(feature|fix|chore|docs|style|refactor|test)/[a-zA-Z0-9_.-]+$"
+
+# Default-constructed models, built once and only read by the tests below.
+_DEFAULT_CONFIG = PolicyConfig()
+_DEFAULT_BN = BranchNamingPolicy()
+_DEFAULT_CC = ConventionalCommitPolicy()
+_DEFAULT_RI = RequireIssueNumberPolicy()
+_DEFAULT_DP = DisallowedPatternsPolicy()
+_DEFAULT_FS = FileSizePolicy()
+
 
 @pytest.fixture
 def temp_config_file(tmp_path):
@@ -26,8 +44,12 @@ def temp_config_file(tmp_path):
     file_path = tmp_path / DEFAULT_CONFIG_FILENAME
 
     def _create_config(content_dict):
-        with open(file_path, "w") as f:
-            yaml.dump(content_dict, f)
+        if not content_dict:  # {} or None: an empty file, no YAML emitter needed
+            file_path.write_bytes(b"")
+            return file_path
+        file_path.write_bytes(
+            yaml.dump(content_dict, Dumper=SafeDumper, encoding="utf-8")
+        )
         return file_path
 
     yield _create_config
@@ -40,42 +62,31 @@ def test_load_config_default_values():
         config_path="non_existent_file.yml"
     )  # Should trigger default loading path if not found
     assert isinstance(config, PolicyConfig)
+    assert config == _DEFAULT_CONFIG
     assert config.branch_naming.enabled is True
-    assert (
-        config.branch_naming.pattern.pattern
-        == "^(feature|fix|chore|docs|style|refactor|test)/[a-zA-Z0-9_.-]+$"
-    )
+    assert config.branch_naming.pattern.pattern == _DEFAULT_BRANCH_PATTERN
     assert config.commit_messages.enabled is True
     assert config.file_size.max_bytes == 1048576
 
 
-def test_load_config_from_file(temp_config_file):
-    """Test loading a valid configuration from a YAML file."""
-    custom_config_data = {
-        "branch_naming": {"pattern": "^custom/.+$", "enabled": True},
-        "commit_messages": {
-            "conventional_commit": {"types": ["task", "bugfix"]},
-            "require_issue_number": {"enabled": True, "pattern": "TASK-\\d+"},
-            "enabled": True,
-        },
-        "disallowed_patterns": {
-            "patterns": [
-                {"pattern": "TEMP_SECRET", "message": "Do not commit temp secrets."}
-            ],
-            "enabled": True,
-        },
-        "file_size": {"max_bytes": 5000, "enabled": False},
-    }
-    config_file_path = temp_config_file(custom_config_data)
-
-    # Temporarily change CWD to where tmp_path created the file for auto-detection
-    original_cwd = os.getcwd()
-    os.chdir(config_file_path.parent)
-    try:
-        config = load_config()  # Test auto-detection
-    finally:
-        os.chdir(original_cwd)
-
+_CUSTOM_CONFIG_DATA = {
+    "branch_naming": {"pattern": "^custom/.+$", "enabled": True},
+    "commit_messages": {
+        "conventional_commit": {"types": ["task", "bugfix"]},
+        "require_issue_number": {"enabled": True, "pattern": "TASK-\\d+"},
+        "enabled": True,
+    },
+    "disallowed_patterns": {
+        "patterns": [
+            {"pattern": "TEMP_SECRET", "message": "Do not commit temp secrets."}
+        ],
+        "enabled": True,
+    },
+    "file_size": {"max_bytes": 5000, "enabled": False},
+}
+
+
+def _check_custom_config(config):
     assert config.branch_naming.pattern.pattern == "^custom/.+$"
     assert config.commit_messages.conventional_commit.types == ["task", "bugfix"]
     assert config.commit_messages.require_issue_number.enabled is True
@@ -86,63 +97,57 @@ def test_load_config_from_file(temp_config_file):
     assert config.file_size.enabled is False
 
 
-def test_load_config_empty_file(temp_config_file):
-    """Test loading an empty YAML file, should use defaults."""
-    config_file_path = temp_config_file({})  # Empty dict makes an empty YAML file
-
-    original_cwd = os.getcwd()
-    os.chdir(config_file_path.parent)
-    try:
-        config = load_config()
-    finally:
-        os.chdir(original_cwd)
-
+def _check_empty_config(config):
     assert isinstance(config, PolicyConfig)
     assert config.branch_naming.enabled is True  # Check a default value
 
 
-def test_load_config_partial_config(temp_config_file):
-    """Test loading a file with only some sections defined."""
-    partial_data = {"branch_naming": {"enabled": False}}
-    config_file_path = temp_config_file(partial_data)
-    original_cwd = os.getcwd()
-    os.chdir(config_file_path.parent)
-    try:
-        config = load_config()
-    finally:
-        os.chdir(original_cwd)
-
+def _check_partial_config(config):
     assert config.branch_naming.enabled is False
     assert config.commit_messages.enabled is True  # Default
     assert config.file_size.max_bytes == 1048576  # Default
 
 
-def test_load_config_invalid_yaml(temp_config_file):
+@pytest.mark.parametrize(
+    "data, checks",
+    [
+        pytest.param(_CUSTOM_CONFIG_DATA, _check_custom_config, id="full"),
+        # Empty dict makes an empty YAML file, which should use defaults
+        pytest.param({}, _check_empty_config, id="empty"),
+        # Only some sections defined; the rest keep their defaults
+        pytest.param(
+            {"branch_naming": {"enabled": False}}, _check_partial_config, id="partial"
+        ),
+    ],
+)
+def test_load_config_from_file(temp_config_file, monkeypatch, data, checks):
+    """Test auto-detecting and loading a YAML config file from the CWD."""
+    config_file_path = temp_config_file(data)
+
+    # Change CWD to where tmp_path created the file for auto-detection
+    monkeypatch.chdir(config_file_path.parent)
+    config = load_config()  # Test auto-detection
+
+    checks(config)
+
+
+def test_load_config_invalid_yaml(temp_config_file, monkeypatch):
     """Test loading a file with invalid YAML content."""
     file_path = temp_config_file(None)  # Create empty file first
-    with open(file_path, "w") as f:
-        f.write("branch_naming: {pattern: 'foo', enabled: true")  # Missing closing }
+    file_path.write_text("branch_naming: {pattern: 'foo', enabled: true")  # Missing closing }
 
-    original_cwd = os.getcwd()
-    os.chdir(file_path.parent)
-    with pytest.raises(ValueError, match="Error parsing YAML configuration file"):
-        try:
-            load_config()
-        finally:
-            os.chdir(original_cwd)
+    monkeypatch.chdir(file_path.parent)
+    with pytest.raises(ValueError, match=_RE_YAML_ERR):
+        load_config()
 
 
-def test_load_config_validation_error(temp_config_file):
+def test_load_config_validation_error(temp_config_file, monkeypatch):
     """Test loading a file with valid YAML but data that fails Pydantic validation."""
     invalid_data = {"file_size": {"max_bytes": "not-an-integer"}}
     config_file_path = temp_config_file(invalid_data)
-    original_cwd = os.getcwd()
-    os.chdir(config_file_path.parent)
-    with pytest.raises(ValueError, match="Configuration validation error"):
-        try:
-            load_config()
-        finally:
-            os.chdir(original_cwd)
+    monkeypatch.chdir(config_file_path.parent)
+    with pytest.raises(ValueError, match=_RE_VALIDATION_ERR):
+        load_config()
 
 
 def test_regex_compilation_in_models():
@@ -172,7 +177,7 @@ def test_invalid_regex_pattern_in_models():
         DisallowedPatternItem(pattern="(?<invalid)")
 
 
-def test_default_config_file_search_logic(tmp_path):
+def test_default_config_file_search_logic(tmp_path, monkeypatch):
     """Test the search logic for the default config file."""
     # Setup: create a .pr-policy.yml in a subdirectory
     project_root = tmp_path
@@ -180,68 +185,59 @@ def test_default_config_file_search_logic(tmp_path):
     sub_dir.mkdir(parents=True)
 
     config_content = {"branch_naming": {"pattern": "^search_logic_test/.+$"}}
-    with open(sub_dir / DEFAULT_CONFIG_FILENAME, "w") as f:
-        yaml.dump(config_content, f)
+    (sub_dir / DEFAULT_CONFIG_FILENAME).write_bytes(
+        yaml.dump(config_content, Dumper=SafeDumper, encoding="utf-8")
+    )
 
     # Test 1: Run from a deeper directory, should find the file in parent
     current_deeper_dir = sub_dir / "deeper"
     current_deeper_dir.mkdir()
 
-    original_cwd = os.getcwd()
-    os.chdir(current_deeper_dir)
-    try:
-        config = load_config()  # No explicit path, should search up
-        assert config.branch_naming.pattern.pattern == "^search_logic_test/.+$"
-    finally:
-        os.chdir(original_cwd)
+    monkeypatch.chdir(current_deeper_dir)
+    config = load_config()  # No explicit path, should search up
+    assert config.branch_naming.pattern.pattern == "^search_logic_test/.+$"
 
     # Test 2: Run from a directory where it doesn't exist (and not in parents up to a point)
     # This should use defaults if it doesn't find it all the way up to where test is run
     # For this test, we ensure it's NOT in tmp_path itself
     other_dir = tmp_path / "other_dir_no_config"
     other_dir.mkdir()
-    os.chdir(other_dir)
-    try:
-        config_defaults = load_config()
-        assert (
-            config_defaults.branch_naming.pattern.pattern
-            == BranchNamingPolicy().pattern.pattern
-        )  # Default
-    finally:
-        os.chdir(original_cwd)
+    monkeypatch.chdir(other_dir)
+    config_defaults = load_config()
+    assert (
+        config_defaults.branch_naming.pattern.pattern
+        == _DEFAULT_BN.pattern.pattern
+    )  # Default
 
 
 # Test specific model default values
 def test_branch_naming_policy_defaults():
-    policy = BranchNamingPolicy()
+    policy = _DEFAULT_BN
     assert policy.enabled is True
-    assert (
-        policy.pattern.pattern
-        == "^(feature|fix|chore|docs|style|refactor|test)/[a-zA-Z0-9_.-]+$"
-    )
+    assert policy.pattern.pattern == _DEFAULT_BRANCH_PATTERN
 
 
 def test_conventional_commit_policy_defaults():
-    policy = ConventionalCommitPolicy()
+    policy = _DEFAULT_CC
     assert policy.enabled is True
     assert policy.types == ["feat", "fix", "docs", "style", "refactor", "test", "chore"]
 
 
 def test_require_issue_number_policy_defaults():
-    policy = RequireIssueNumberPolicy()
+    policy = _DEFAULT_RI
     assert policy.enabled is False
     assert policy.pattern.pattern == "\\[[A-Z]+-[0-9]+\\]"
     assert policy.in_commit_body is True
 
 
 def test_disallowed_patterns_policy_defaults():
-    policy = DisallowedPatternsPolicy()
+    policy = _DEFAULT_DP
     assert policy.enabled is True
     assert policy.patterns == []
 
 
 def test_file_size_policy_defaults():
-    policy = FileSizePolicy()
+    policy = _DEFAULT_FS
     assert policy.enabled is True
     assert policy.max_bytes == 1048576
     assert policy.ignore_extensions == []
@@ -1,6 +1,7 @@
 import pytest
 import re
-from typing import Optional, AnyStr, List, Pattern
+from functools import lru_cache
+from typing import List, Pattern
 
 # Adjust import paths based on test execution context
 from src.mcp_tools.pr_reviewer.config import (
@@ -46,6 +47,21 @@ def test_check_branch_name_policy_detached_head():
 
 # --- Tests for commit policies ---
 
+# Parametrize rows repeat the same policy settings, so each distinct policy is
+# validated once and reused. Policies are only read by the checks.
+
+
+@lru_cache(maxsize=None)
+def _conv_policy(types: tuple) -> ConventionalCommitPolicy:
+    return ConventionalCommitPolicy(enabled=True, types=list(types))
+
+
+@lru_cache(maxsize=None)
+def _issue_policy(pattern_str: str, in_commit_body: bool) -> RequireIssueNumberPolicy:
+    return RequireIssueNumberPolicy(
+        pattern=pattern_str, in_commit_body=in_commit_body, enabled=True
+    )
+
 
 @pytest.mark.parametrize(
     "subject, types, is_valid",
@@ -62,7 +78,7 @@ def test_check_branch_name_policy_detached_head():
     ],
 )
 def test_check_conventional_commit_format(subject, types, is_valid):
-    policy = ConventionalCommitPolicy(enabled=True, types=types)
+    policy = _conv_policy(tuple(types))
     violations = commit_policies.check_conventional_commit_format(
         subject, "sha123", policy
     )
@@ -102,9 +118,7 @@ def test_check_conventional_commit_format_disabled():
 def test_check_commit_for_issue_number(
     body, pattern_str, pr_title, pr_body, in_commit_body, expected_violations_count
 ):
-    policy = RequireIssueNumberPolicy(
-        pattern=pattern_str, in_commit_body=in_commit_body, enabled=True
-    )
+    policy = _issue_policy(pattern_str, in_commit_body)
     violations = commit_policies.check_commit_for_issue_number(
         body, pr_title, pr_body, "sha123", policy
     )
@@ -153,53 +167,25 @@ mock_file_contents = {
 }
 
 
-def mock_get_file_content(filepath: str) -> Optional[AnyStr]:
-    return mock_file_contents.get(filepath)
+# Pattern items shared by the parametrize rows below; each is validated once.
+_P_API = DisallowedPatternItem(pattern="API_KEY\\s*=", enabled=True)
+_P_PWD = DisallowedPatternItem(pattern="PASSWORD\\s*=", enabled=True)
+_P_SECRET = DisallowedPatternItem(pattern="SECRET", enabled=True)
+_P_API_DISABLED = DisallowedPatternItem(pattern="API_KEY", enabled=False)
+_P_SECRET_KEY = DisallowedPatternItem(pattern="SECRET_KEY", enabled=True)
+_P_INVALID = DisallowedPatternItem(pattern="Invalid", enabled=True)
 
 
 @pytest.mark.parametrize(
     "filepath, patterns_config, expected_violations_count, expected_messages_contain",
     [
-        (
-            "secrets.py",
-            [DisallowedPatternItem(pattern="API_KEY\\s*=", enabled=True)],
-            1,
-            ["API_KEY"],
-        ),
-        (
-            "secrets.py",
-            [DisallowedPatternItem(pattern="PASSWORD\\s*=", enabled=True)],
-            1,
-            ["PASSWORD"],
-        ),
-        (
-            "secrets.py",
-            [
-                DisallowedPatternItem(pattern="API_KEY\\s*=", enabled=True),
-                DisallowedPatternItem(pattern="PASSWORD\\s*=", enabled=True),
-            ],
-            2,
-            ["API_KEY", "PASSWORD"],
-        ),
-        ("clean.txt", [DisallowedPatternItem(pattern="SECRET", enabled=True)], 0, []),
-        (
-            "secrets.py",
-            [DisallowedPatternItem(pattern="API_KEY", enabled=False)],
-            0,
-            [],
-        ),  # Disabled pattern
-        (
-            "binary.data",
-            [DisallowedPatternItem(pattern="SECRET_KEY", enabled=True)],
-            0,
-            [],
-        ),  # Binary skipped
-        (
-            "utf8_error.txt",
-            [DisallowedPatternItem(pattern="Invalid", enabled=True)],
-            0,
-            [],
-        ),  # UTF-8 error skipped
+        ("secrets.py", [_P_API], 1, ["API_KEY"]),
+        ("secrets.py", [_P_PWD], 1, ["PASSWORD"]),
+        ("secrets.py", [_P_API, _P_PWD], 2, ["API_KEY", "PASSWORD"]),
+        ("clean.txt", [_P_SECRET], 0, []),
+        ("secrets.py", [_P_API_DISABLED], 0, []),  # Disabled pattern
+        ("binary.data", [_P_SECRET_KEY], 0, []),  # Binary skipped
+        ("utf8_error.txt", [_P_INVALID], 0, []),  # UTF-8 error skipped
     ],
 )
 def test_check_content_disallowed_patterns(
@@ -207,7 +193,7 @@ def test_check_content_disallowed_patterns(
 ):
     policy = DisallowedPatternsPolicy(patterns=patterns_config, enabled=True)
     violations = file_policies.check_content_disallowed_patterns(
-        filepath, mock_get_file_content, policy
+        filepath, mock_file_contents.get, policy
     )
     assert len(violations) == expected_violations_count
     for msg_part in expected_messages_contain:
@@ -217,11 +203,9 @@ def test_check_content_disallowed_patterns(
 
 
 def test_check_content_disallowed_patterns_disabled():
-    policy = DisallowedPatternsPolicy(
-        patterns=[DisallowedPatternItem(pattern="SECRET", enabled=True)], enabled=False
-    )
+    policy = DisallowedPatternsPolicy(patterns=[_P_SECRET], enabled=False)
     violations = file_policies.check_content_disallowed_patterns(
-        "secrets.py", mock_get_file_content, policy
+        "secrets.py", mock_file_contents.get, policy
     )
     assert not violations
 
@@ -237,10 +221,6 @@ mock_file_sizes = {
 }
 
 
-def mock_get_file_size(filepath: str) -> Optional[int]:
-    return mock_file_sizes.get(filepath)
-
-
 @pytest.mark.parametrize(
     "filepath, max_bytes, ignore_ext, ignore_paths, expected_violations_count",
     [
@@ -262,7 +242,7 @@ def test_check_file_size_policy(
         enabled=True,
     )
     violations = file_policies.check_file_size_policy(
-        filepath, mock_get_file_size, policy
+        filepath, mock_file_sizes.get, policy
     )
     assert len(violations) == expected_violations_count
 
@@ -270,6 +250,6 @@ def test_check_file_size_policy(
 def test_check_file_size_policy_disabled():
     policy = FileSizePolicy(max_bytes=10, enabled=False)
     violations = file_policies.check_file_size_policy(
-        "large.exe", mock_get_file_size, policy
+        "large.exe", mock_file_sizes.get, policy
     )
     assert not violations
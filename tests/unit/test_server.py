@@ -1,12 +1,19 @@
 import pytest
 from fastapi.testclient import TestClient
-from src.mcp_server.main import app  # Import the FastAPI app
+from src.mcp_server.main import app, CONTEXT_STORE  # Import the FastAPI app and its store
 
-# Create a TestClient instance for making requests to the app
-client = TestClient(app)
 
+@pytest.fixture(scope="session")
+def client():
+    """
+    A single TestClient shared by every test in the session.
+    Entering it as a context manager runs the app's startup/shutdown once.
+    """
+    with TestClient(app) as c:
+        yield c
 
-def test_health_check():
+
+def test_health_check(client):
     """
     Test the /health endpoint.
     It should return a 200 OK status and a JSON response with {"status": "ok"}.
@@ -16,7 +23,7 @@ def test_health_check():
     assert response.json() == {"status": "ok"}
 
 
-def test_create_context_success():
+def test_create_context_success(client):
     """
     Test successful context creation.
     """
@@ -28,15 +35,14 @@ def test_create_context_success():
         "context_id": context_id,
     }
 
-    # Verify it's in the store (optional, depends on how much you want to test internal state)
-    # This requires access to CONTEXT_STORE or a way to inspect it.
-    # For now, we trust the response. A get request could also verify.
+    # Verify it's retrievable. Both requests go through the session client, so
+    # the app's lifespan is already open and neither call re-runs startup.
     get_response = client.get(f"/v1/contexts/{context_id}")
     assert get_response.status_code == 200
     assert get_response.json() == {"context_id": context_id, "data": {}}
 
 
-def test_create_context_conflict():
+def test_create_context_conflict(client):
     """
     Test creating a context that already exists.
     """
@@ -49,7 +55,7 @@ def test_create_context_conflict():
     assert response.json() == {"detail": "Context already exists"}
 
 
-def test_get_context_not_found():
+def test_get_context_not_found(client):
     """
     Test retrieving a context that does not exist.
     """
@@ -61,7 +67,7 @@ def test_get_context_not_found():
 # Clean up contexts created during tests to ensure test isolation if needed
 # For simple in-memory store, this might not be strictly necessary if TestClient re-initializes state,
 # but good practice for more complex scenarios.
-# However, TestClient(app) uses the same app instance.
+# However, the session-scoped client shares one app instance across all tests.
 # We can clear the store manually for now after certain tests or globally.
 
 
@@ -76,6 +82,4 @@ def clear_context_store_after_each_test():
     yield  # This is where the test runs
 
     # Teardown: Clear the CONTEXT_STORE
-    from src.mcp_server.main import CONTEXT_STORE
-
     CONTEXT_STORE.clear()